@@ -3,6 +3,14 @@ import matplotlib.pyplot as plt
 import csv
 from mpl_toolkits.mplot3d import Axes3D
 
+from outputwriters import OutputWriterPool
+from surfaceresample import CylinderSurface, resample_on_surface
+
+# Wrap parameters
+ROTATION_ANGLE_DEGREES = 60    # Rotation before mapping
+CYLINDER_RADIUS = 2000         # Constant radius of cylinder
+SURFACE_POINT_SPACING = None   # Resample to this geodesic step on the cylinder (None = keep the flat spacing)
+
 # -------------------------------
 # 1. Read CSV Data
 # -------------------------------
@@ -31,9 +39,14 @@ def rotate_points(x, y, theta_degrees):
 # -------------------------------
 # 3. Map Points to Cylinder
 # -------------------------------
-def map_points_to_cylinder(x, y, cylinder_radius=20):
-    """Maps rotated (x,y) points onto a cylinder while preserving Y values."""
-    center_x = (np.min(x) + np.max(x)) / 2.0
+def map_points_to_cylinder(x, y, cylinder_radius=20, center_x=None):
+    """
+    Maps rotated (x,y) points onto a cylinder while preserving Y values.
+    center_x defaults to the middle of the x range; pass it explicitly when
+    mapping a large point set chunk by chunk.
+    """
+    if center_x is None:
+        center_x = (np.min(x) + np.max(x)) / 2.0
     dx = x - center_x  # Offset from center
     theta = dx / cylinder_radius  # Convert offset to an angle
     new_x = cylinder_radius * np.sin(theta)
@@ -144,20 +157,30 @@ def main():
     original_x, original_y = read_points_from_csv("ellipse_points.csv")
     
     # Parameters
-    rotation_angle_degrees = 60    # Rotation before mapping
-    cylinder_radius = 2000           # Constant radius of cylinder
+    rotation_angle_degrees = ROTATION_ANGLE_DEGREES
+    cylinder_radius = CYLINDER_RADIUS
     
     # Rotate flat points
     rotated_x, rotated_y = rotate_points(original_x, original_y, rotation_angle_degrees)
     
     # Map onto the cylinder
-    mapped_x, mapped_y, mapped_z = map_points_to_cylinder(rotated_x, rotated_y, cylinder_radius=cylinder_radius)
-    
-    # Export sticker coordinates
-    export_sticker_coordinates_to_csv(mapped_x, mapped_y, mapped_z, filename="sticker_coordinates.csv")
+    center_x = (np.min(rotated_x) + np.max(rotated_x)) / 2.0
+    mapped_x, mapped_y, mapped_z = map_points_to_cylinder(rotated_x, rotated_y, cylinder_radius=cylinder_radius,
+                                                          center_x=center_x)
+
+    # Optionally make the wrapped points equally spaced along the cylinder surface
+    if SURFACE_POINT_SPACING:
+        surface = CylinderSurface(cylinder_radius, center_x)
+        mapped_x, mapped_y, mapped_z = resample_on_surface(surface, mapped_x, mapped_y, mapped_z,
+                                                           SURFACE_POINT_SPACING)
     
-    # Plot everything
-    plot_mapping(original_x, original_y, rotated_x, rotated_y, mapped_x, mapped_y, mapped_z, cylinder_radius)
+    with OutputWriterPool() as writers:
+        # Export sticker coordinates in the background while plotting
+        writers.submit(export_sticker_coordinates_to_csv, mapped_x, mapped_y, mapped_z,
+                       filename="sticker_coordinates.csv")
+
+        # Plot everything
+        plot_mapping(original_x, original_y, rotated_x, rotated_y, mapped_x, mapped_y, mapped_z, cylinder_radius)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,108 @@
+import numpy as np
+
+
+# -------------------------------
+# Arc-Length-Indexed Path
+# -------------------------------
+class ArcLengthPath:
+    """
+    A polyline with a cumulative arc-length index.
+
+    Built once in O(n), it answers "point at distance s along the path" and
+    "span from s0 to s1" in O(log n) by binary search on the cumulative
+    lengths followed by linear interpolation inside the matching segment.
+    Queries accept whole arrays of s values at once.
+    """
+
+    def __init__(self, *coords):
+        """Takes one 1D array per coordinate, e.g. ArcLengthPath(x, y) or ArcLengthPath(x, y, z)."""
+        self.coords = [np.ascontiguousarray(c, dtype=float) for c in coords]
+        if len(self.coords) < 1 or len({len(c) for c in self.coords}) != 1:
+            raise ValueError("coordinate arrays must be non-empty and equally long")
+        if len(self.coords[0]) < 2:
+            raise ValueError("a path needs at least two vertices")
+
+        # Accumulate squared segment lengths axis by axis to keep temporaries small
+        segment_sq = np.zeros(len(self.coords[0]) - 1)
+        for c in self.coords:
+            d = np.diff(c)
+            segment_sq += d * d
+        self.cumulative = np.empty(len(self.coords[0]))
+        self.cumulative[0] = 0.0
+        np.cumsum(np.sqrt(segment_sq), out=self.cumulative[1:])
+
+    @classmethod
+    def from_csv(cls, filename):
+        """Builds a path from a coordinate CSV with a header row (ellipse_points.csv, sticker_coordinates.csv)."""
+        data = np.loadtxt(filename, delimiter=",", skiprows=1, ndmin=2)
+        return cls(*data.T)
+
+    @classmethod
+    def from_spiral(cls, spiral, num_points_per_ring=2000):
+        """Builds a path from a ScarfSpiral, dropping the duplicated point where rings meet."""
+        if spiral.rings < 1:
+            raise ValueError("the spiral has no rings (the start ellipse already reaches the bounding shape)")
+        x, y = spiral.sample(num_points_per_ring)
+        last_x, last_y = spiral(spiral.rings)
+        return cls(np.append(x[:, :-1].ravel(), last_x), np.append(y[:, :-1].ravel(), last_y))
+
+    @classmethod
+    def from_rings(cls, rings):
+        """
+        Builds one path from consecutive rings ((x, y) arrays), dropping the
+        first point of a ring when it repeats the last point of the one before.
+        """
+        if len(rings) == 0:
+            raise ValueError("cannot build a path from zero rings")
+        coords = [[np.asarray(c, dtype=float)] for c in rings[0]]
+        for previous, ring in zip(rings, rings[1:]):
+            skip = 1 if np.allclose([p[-1] for p in previous], [c[0] for c in ring]) else 0
+            for column, c in zip(coords, ring):
+                column.append(np.asarray(c, dtype=float)[skip:])
+        return cls(*(np.concatenate(column) for column in coords))
+
+    @property
+    def length(self):
+        """Total arc length of the path."""
+        return self.cumulative[-1]
+
+    def __len__(self):
+        return len(self.cumulative)
+
+    def _locate(self, s):
+        """Returns the segment index and in-segment fraction for arc length(s) s."""
+        s = np.clip(np.asarray(s, dtype=float), 0.0, self.length)
+        index = np.searchsorted(self.cumulative, s, side="right") - 1
+        index = np.clip(index, 0, len(self.cumulative) - 2)
+        start = self.cumulative[index]
+        segment = self.cumulative[index + 1] - start
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(segment > 0, (s - start) / segment, 0.0)
+        return index, frac
+
+    def point_at(self, s):
+        """Returns the coordinates at arc length(s) s, clipped to the ends of the path."""
+        index, frac = self._locate(s)
+        return tuple(c[index] + frac * (c[index + 1] - c[index]) for c in self.coords)
+
+    def subpath(self, s0, s1):
+        """Returns the coordinates of the span from s0 to s1, with interpolated end points."""
+        s0, s1 = sorted((float(np.clip(s0, 0, self.length)), float(np.clip(s1, 0, self.length))))
+        first = np.searchsorted(self.cumulative, s0, side="right")
+        last = np.searchsorted(self.cumulative, s1, side="left")
+        start, end = self.point_at(s0), self.point_at(s1)
+        return tuple(np.concatenate(([p0], c[first:last], [p1]))
+                     for c, p0, p1 in zip(self.coords, start, end))
+
+    def resample(self, spacing, start=0.0, include_end=True):
+        """
+        Returns the coordinates of points every `spacing` along the path,
+        beginning at arc length `start`, in one vectorized pass. With
+        include_end the final vertex is kept, so only the last gap may be short.
+        """
+        if spacing <= 0:
+            raise ValueError("spacing must be positive")
+        s = np.arange(start, self.length, spacing)
+        if include_end and (len(s) == 0 or s[-1] < self.length):
+            s = np.append(s, self.length)
+        return self.point_at(s)
@@ -0,0 +1,171 @@
+import argparse
+import csv
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+wrap = importlib.import_module("3dmodelwrappy")  # Module name starts with a digit
+
+SUMMARY_FIELDS = ["input", "output", "rotation_angle_degrees", "cylinder_radius", "points",
+                  "wrap_angle_degrees", "status"]
+
+
+# -------------------------------
+# 1. Manifest
+# -------------------------------
+def read_manifest(filename):
+    """
+    Reads a batch manifest CSV with columns input, output and optionally
+    rotation_angle_degrees and cylinder_radius (defaulting to the values at
+    the top of 3dmodelwrappy.py). Returns a list of design dicts.
+    """
+    designs = []
+    with open(filename, mode="r", newline="") as file:
+        for line, row in enumerate(csv.DictReader(file), start=2):
+            if not row.get("input") or not row.get("output"):
+                raise ValueError(f"{filename}:{line}: every design needs an input and an output file")
+            designs.append({
+                "input": row["input"],
+                "output": row["output"],
+                "rotation_angle_degrees": float(row.get("rotation_angle_degrees") or wrap.ROTATION_ANGLE_DEGREES),
+                "cylinder_radius": float(row.get("cylinder_radius") or wrap.CYLINDER_RADIUS),
+            })
+    return designs
+
+
+def group_by_shape(designs):
+    """Groups designs that share an input file, so each shape is read and packed once."""
+    groups = {}
+    for design in designs:
+        groups.setdefault(design["input"], []).append(design)
+    return list(groups.items())
+
+
+# -------------------------------
+# 2. Vectorized Wrapping of Packed Designs
+# -------------------------------
+def wrap_packed(x, y, starts, rotation_angles, cylinder_radii):
+    """
+    Rotates and wraps many designs in one pass. x and y hold every design's
+    points back to back, design i beginning at starts[i]. Each design's angle
+    and radius are repeated per point, and its own cylinder centre (the middle
+    of its rotated x range) comes from a segmented min/max via reduceat.
+    """
+    counts = np.diff(np.append(starts, len(x)))
+    rotated_x, rotated_y = wrap.rotate_points(x, y, np.repeat(rotation_angles, counts))
+    min_x, max_x = np.minimum.reduceat(rotated_x, starts), np.maximum.reduceat(rotated_x, starts)
+    center_x = np.repeat((min_x + max_x) / 2.0, counts)
+    mapped_x, mapped_y, mapped_z = wrap.map_points_to_cylinder(rotated_x, rotated_y,
+                                                              np.repeat(cylinder_radii, counts), center_x)
+    wrap_angles = np.degrees((max_x - min_x) / cylinder_radii)
+    return mapped_x, mapped_y, mapped_z, wrap_angles
+
+
+def write_sticker_coordinates(filename, x, y, z):
+    """Writes one design's sticker coordinates, in the same format as 3dmodelwrappy.py."""
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["X", "Y", "Z"])  # Header row
+        writer.writerows(zip(x.tolist(), y.tolist(), z.tolist()))
+
+
+def wrap_groups(groups):
+    """
+    Worker task: reads each group's shape once, packs all of the task's
+    designs into ragged arrays, wraps them in one vectorized pass and writes
+    one output file per design. Returns the summary rows.
+    """
+    summary, xs, ys, starts, packed = [], [], [], [], []
+    total = 0
+    for input_file, designs in groups:
+        try:
+            x, y = wrap.read_points_from_csv(input_file)
+            if len(x) == 0:
+                raise ValueError("no points")
+        except (OSError, ValueError, IndexError) as error:
+            summary.extend({**design, "points": 0, "wrap_angle_degrees": "", "status": f"error: {error}"}
+                           for design in designs)
+            continue
+        for design in designs:
+            xs.append(x)
+            ys.append(y)
+            starts.append(total)
+            packed.append(design)
+            total += len(x)
+
+    if not packed:
+        return summary
+    starts = np.array(starts)
+    mapped_x, mapped_y, mapped_z, wrap_angles = wrap_packed(
+        np.concatenate(xs), np.concatenate(ys), starts,
+        np.array([design["rotation_angle_degrees"] for design in packed]),
+        np.array([design["cylinder_radius"] for design in packed]))
+
+    ends = np.append(starts[1:], total)
+    for design, start, end, wrap_angle in zip(packed, starts, ends, wrap_angles):
+        try:
+            write_sticker_coordinates(design["output"], mapped_x[start:end], mapped_y[start:end],
+                                      mapped_z[start:end])
+            status = "ok"
+        except OSError as error:
+            status = f"error: {error}"
+        summary.append({**design, "points": int(end - start), "wrap_angle_degrees": float(wrap_angle),
+                        "status": status})
+    return summary
+
+
+# -------------------------------
+# 3. Batch Run
+# -------------------------------
+def run_batch(designs, workers=None, tasks_per_worker=4):
+    """
+    Wraps every design in the manifest. Shape groups are dealt round-robin
+    into tasks and spread over a process pool (workers=None uses all cores,
+    workers=1 runs in this process). Returns the summary rows in manifest order.
+    """
+    groups = group_by_shape(designs)
+    workers = workers or os.cpu_count() or 1
+    task_count = max(1, min(len(groups), workers * tasks_per_worker))
+    tasks = [groups[i::task_count] for i in range(task_count)]
+
+    if workers == 1 or task_count == 1:
+        results = [wrap_groups(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(wrap_groups, tasks))
+
+    by_output = {(row["input"], row["output"]): row for rows in results for row in rows}
+    return [by_output[(design["input"], design["output"])] for design in designs]
+
+
+def write_summary(rows, filename="batch_summary.csv"):
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wrap many sticker designs onto their cylinders in one run.")
+    parser.add_argument("manifest", help="CSV with input, output, rotation_angle_degrees, cylinder_radius columns")
+    parser.add_argument("--summary", default="batch_summary.csv", help="Where to write the batch summary")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    designs = read_manifest(args.manifest)
+    rows = run_batch(designs, args.workers)
+    write_summary(rows, args.summary)
+
+    failed = sum(1 for row in rows if row["status"] != "ok")
+    print(f"Wrapped {len(rows) - failed} of {len(rows)} designs in {time.perf_counter() - start:.2f} s "
+          f"(summary: {args.summary})")
+
+if __name__ == "__main__":
+    main()
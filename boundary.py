@@ -0,0 +1,338 @@
+import re
+
+import numpy as np
+
+# Grid cell states of PolygonBoundary
+_OUTSIDE, _INSIDE, _EDGE = 0, 1, 2
+
+
+# -------------------------------
+# 1. Bounding Ellipse
+# -------------------------------
+class EllipseBoundary:
+    """The original bounding ellipse x^2/a^2 + y^2/b^2 < 1, centred on the origin."""
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+        self.bounds = (-a, a, -b, b)  # (min_x, max_x, min_y, max_y)
+
+    def contains(self, x, y):
+        """True for points strictly inside the ellipse."""
+        return np.asarray(x)**2 / self.a**2 + np.asarray(y)**2 / self.b**2 < 1
+
+    def ring_escapes(self, x, y):
+        """True if any point of a ring lies on or outside the boundary."""
+        return bool(np.any(x**2 / self.a**2 + y**2 / self.b**2 >= 1))
+
+    def outline(self, num_points=2000):
+        """Points along the boundary, for plotting."""
+        theta = np.linspace(0, 2 * np.pi, num_points)
+        return self.a * np.cos(theta), self.b * np.sin(theta)
+
+
+# -------------------------------
+# 2. Polygon Boundary with Grid Index
+# -------------------------------
+class PolygonBoundary:
+    """
+    Any closed boundary given as one or more polygons (the even-odd rule
+    applies, so inner loops become holes).
+
+    At construction the bounding box is split into a grid. Cells that no edge
+    passes through are classified once as fully inside or outside, and the
+    edges are indexed by the grid row their y-range overlaps. A point in a
+    classified cell is resolved by a lookup; only points in cells an edge
+    crosses run the crossing-number test, against that row's edges alone.
+    """
+
+    def __init__(self, *polygons, grid_size=64):
+        loops = [np.asarray(polygon, dtype=float).reshape(-1, 2) for polygon in polygons]
+        loops = [loop[:-1] if len(loop) > 1 and np.array_equal(loop[0], loop[-1]) else loop for loop in loops]
+        loops = [loop for loop in loops if len(loop) >= 3]
+        if not loops:
+            raise ValueError("a polygon boundary needs at least three vertices")
+        self.polygons = loops
+        starts = np.concatenate(loops)
+        ends = np.concatenate([np.roll(loop, -1, axis=0) for loop in loops])
+        self.x1, self.y1 = starts[:, 0], starts[:, 1]
+        self.x2, self.y2 = ends[:, 0], ends[:, 1]
+
+        min_x, min_y = starts.min(axis=0)
+        max_x, max_y = starts.max(axis=0)
+        self.bounds = (min_x, max_x, min_y, max_y)
+        self.grid_size = grid_size
+        self.cell_w = (max_x - min_x) / grid_size or 1.0
+        self.cell_h = (max_y - min_y) / grid_size or 1.0
+        self._build_row_index()
+        self._classify_cells()
+
+    def _cells(self, x, y):
+        min_x, _, min_y, _ = self.bounds
+        col = np.clip(((x - min_x) / self.cell_w).astype(np.int64), 0, self.grid_size - 1)
+        row = np.clip(((y - min_y) / self.cell_h).astype(np.int64), 0, self.grid_size - 1)
+        return col, row
+
+    def _build_row_index(self):
+        """CSR list of the edges whose y-range overlaps each grid row."""
+        _, _, min_y, _ = self.bounds
+        low = np.clip(((np.minimum(self.y1, self.y2) - min_y) / self.cell_h).astype(np.int64), 0, self.grid_size - 1)
+        high = np.clip(((np.maximum(self.y1, self.y2) - min_y) / self.cell_h).astype(np.int64), 0, self.grid_size - 1)
+        counts = high - low + 1
+        edges = np.repeat(np.arange(len(low)), counts)
+        rows = np.repeat(low, counts) + np.arange(len(edges)) - np.repeat(np.cumsum(counts) - counts, counts)
+        order = np.argsort(rows, kind="stable")
+        self.row_edges = edges[order]
+        self.row_starts = np.searchsorted(rows[order], np.arange(self.grid_size + 1))
+
+    def _classify_cells(self):
+        """Marks the cells edges pass through, then classifies the rest by their centres."""
+        # Split edges into pieces no longer than a cell; each piece's bounding box covers its cells
+        lengths = np.maximum(np.abs(self.x2 - self.x1) / self.cell_w, np.abs(self.y2 - self.y1) / self.cell_h)
+        pieces = np.ceil(lengths).astype(np.int64) + 1
+        edge = np.repeat(np.arange(len(pieces)), pieces)
+        step = (np.arange(len(edge)) - np.repeat(np.cumsum(pieces) - pieces, pieces)) / np.repeat(pieces, pieces)
+        next_step = step + 1 / np.repeat(pieces, pieces)
+        px0 = self.x1[edge] + (self.x2 - self.x1)[edge] * step
+        py0 = self.y1[edge] + (self.y2 - self.y1)[edge] * step
+        px1 = self.x1[edge] + (self.x2 - self.x1)[edge] * next_step
+        py1 = self.y1[edge] + (self.y2 - self.y1)[edge] * next_step
+        col0, row0 = self._cells(np.minimum(px0, px1), np.minimum(py0, py1))
+        col1, row1 = self._cells(np.maximum(px0, px1), np.maximum(py0, py1))
+
+        state = np.zeros((self.grid_size, self.grid_size), dtype=np.int8)  # Indexed [row, col]
+        for d_col in (0, 1):
+            for d_row in (0, 1):
+                col, row = np.minimum(col0 + d_col, col1), np.minimum(row0 + d_row, row1)
+                state[row, col] = _EDGE
+
+        free_row, free_col = np.nonzero(state != _EDGE)
+        min_x, _, min_y, _ = self.bounds
+        centre_x = min_x + (free_col + 0.5) * self.cell_w
+        centre_y = min_y + (free_row + 0.5) * self.cell_h
+        state[free_row, free_col] = np.where(self._crossing_test(centre_x, centre_y, free_row), _INSIDE, _OUTSIDE)
+        self.cell_state = state
+
+    def _crossing_test(self, x, y, rows):
+        """Even-odd ray casting (+x direction) of each point against the edges of its grid row."""
+        counts = self.row_starts[rows + 1] - self.row_starts[rows]
+        owner = np.repeat(np.arange(len(x)), counts)
+        offsets = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+        edge = self.row_edges[np.repeat(self.row_starts[rows], counts) + offsets]
+
+        px, py = x[owner], y[owner]
+        x1, y1, x2, y2 = self.x1[edge], self.y1[edge], self.x2[edge], self.y2[edge]
+        straddles = (y1 > py) != (y2 > py)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing_x = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+        crosses = straddles & (px < crossing_x)
+        return np.bincount(owner, weights=crosses, minlength=len(x)) % 2 == 1
+
+    def contains(self, x, y):
+        """True for points inside the boundary (vectorized over arrays of x and y)."""
+        x, y = np.atleast_1d(np.asarray(x, dtype=float)), np.atleast_1d(np.asarray(y, dtype=float))
+        min_x, max_x, min_y, max_y = self.bounds
+        inside = np.zeros(x.shape, dtype=bool)
+        in_box = np.flatnonzero((x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y))
+        col, row = self._cells(x[in_box], y[in_box])
+        state = self.cell_state[row, col]
+        inside[in_box[state == _INSIDE]] = True
+        on_edge = state == _EDGE
+        if np.any(on_edge):
+            candidates = in_box[on_edge]
+            inside[candidates] = self._crossing_test(x[candidates], y[candidates], row[on_edge])
+        return inside
+
+    def ring_escapes(self, x, y):
+        """True if any point of a ring lies outside the boundary."""
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        min_x, max_x, min_y, max_y = self.bounds
+        if x.min() < min_x or x.max() > max_x or y.min() < min_y or y.max() > max_y:
+            return True  # Cheap bounding-box exit
+        return not np.all(self.contains(x, y))
+
+    def outline(self, num_points=None):
+        """Points along the boundary (each polygon closed, NaN between polygons), for plotting."""
+        loops = [np.vstack((loop, loop[:1], [[np.nan, np.nan]])) for loop in self.polygons]
+        points = np.concatenate(loops)[:-1]
+        return points[:, 0], points[:, 1]
+
+    @classmethod
+    def from_svg_path(cls, d, samples_per_curve=32, flip_y=True, center=True, grid_size=64):
+        """
+        Builds a boundary from SVG path data (M, L, H, V, C, S, Q, T, A and Z,
+        absolute or relative). Curves are flattened to samples_per_curve
+        segments. flip_y turns SVG's downward y axis upward, and center moves
+        the shape's bounding-box centre to the origin the spiral grows from.
+        """
+        polygons = parse_svg_path(d, samples_per_curve)
+        if flip_y:
+            polygons = [polygon * [1, -1] for polygon in polygons]
+        if center:
+            stacked = np.concatenate(polygons)
+            middle = (stacked.min(axis=0) + stacked.max(axis=0)) / 2
+            polygons = [polygon - middle for polygon in polygons]
+        return cls(*polygons, grid_size=grid_size)
+
+    @classmethod
+    def rounded_rectangle(cls, width, height, radius, samples_per_corner=16, grid_size=64):
+        """A rounded rectangle centred on the origin (a common label shape)."""
+        radius = min(radius, width / 2, height / 2)
+        hx, hy = width / 2 - radius, height / 2 - radius
+        angles = np.linspace(0, np.pi / 2, samples_per_corner)
+        corners = []
+        for index, (cx, cy) in enumerate(((hx, hy), (-hx, hy), (-hx, -hy), (hx, -hy))):
+            theta = angles + index * np.pi / 2
+            corners.append(np.column_stack((cx + radius * np.cos(theta), cy + radius * np.sin(theta))))
+        return cls(np.concatenate(corners), grid_size=grid_size)
+
+
+# -------------------------------
+# 3. SVG Path Parsing
+# -------------------------------
+_SVG_TOKEN = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_SVG_ARG_COUNTS = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+
+
+def _tokenize_svg_path(d):
+    """Splits path data into commands and numbers; arc flags may be written without separators."""
+    tokens = []
+    arc_arg = None  # Position within the current arc's 7 arguments
+    position = 0
+    while position < len(d):
+        if d[position] in " \t\r\n,":
+            position += 1
+            continue
+        if arc_arg in (3, 4) and d[position] in "01":
+            tokens.append(float(d[position]))  # A flag is always a single digit
+            position += 1
+            arc_arg = (arc_arg + 1) % 7
+            continue
+        match = _SVG_TOKEN.match(d, position)
+        if match is None:
+            raise ValueError(f"invalid SVG path data at {position}: {d[position:position + 10]!r}")
+        token = match.group()
+        if token.isalpha():
+            tokens.append(token)
+            arc_arg = 0 if token in "Aa" else None
+        else:
+            tokens.append(float(token))
+            if arc_arg is not None:
+                arc_arg = (arc_arg + 1) % 7
+        position = match.end()
+    return tokens
+
+
+def _bezier(points, samples):
+    """Samples a quadratic or cubic Bezier (control points as rows), excluding the start point."""
+    t = np.linspace(0, 1, samples + 1)[1:, None]
+    if len(points) == 3:
+        return (1 - t)**2 * points[0] + 2 * (1 - t) * t * points[1] + t**2 * points[2]
+    return ((1 - t)**3 * points[0] + 3 * (1 - t)**2 * t * points[1]
+            + 3 * (1 - t) * t**2 * points[2] + t**3 * points[3])
+
+
+def _arc(start, rx, ry, phi_degrees, large_arc, sweep, end, samples):
+    """Samples an SVG elliptical arc (endpoint parameterisation), excluding the start point."""
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0 or np.array_equal(start, end):
+        return end[None, :]
+    phi = np.radians(phi_degrees)
+    cos_phi, sin_phi = np.cos(phi), np.sin(phi)
+    half = (start - end) / 2
+    x1p = cos_phi * half[0] + sin_phi * half[1]
+    y1p = -sin_phi * half[0] + cos_phi * half[1]
+    scale = x1p**2 / rx**2 + y1p**2 / ry**2
+    if scale > 1:  # Radii too small to reach the end point: scale them up
+        rx, ry = rx * np.sqrt(scale), ry * np.sqrt(scale)
+    numerator = rx**2 * ry**2 - rx**2 * y1p**2 - ry**2 * x1p**2
+    coef = np.sqrt(max(0.0, numerator / (rx**2 * y1p**2 + ry**2 * x1p**2)))
+    if large_arc == sweep:
+        coef = -coef
+    cxp, cyp = coef * rx * y1p / ry, -coef * ry * x1p / rx
+    middle = (start + end) / 2
+    cx = cos_phi * cxp - sin_phi * cyp + middle[0]
+    cy = sin_phi * cxp + cos_phi * cyp + middle[1]
+
+    theta1 = np.arctan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    theta2 = np.arctan2((-y1p - cyp) / ry, (-x1p - cxp) / rx)
+    delta = (theta2 - theta1) % (2 * np.pi)
+    if not sweep and delta > 0:
+        delta -= 2 * np.pi
+    theta = theta1 + delta * np.linspace(0, 1, samples + 1)[1:]
+    x = cos_phi * rx * np.cos(theta) - sin_phi * ry * np.sin(theta) + cx
+    y = sin_phi * rx * np.cos(theta) + cos_phi * ry * np.sin(theta) + cy
+    points = np.column_stack((x, y))
+    points[-1] = end  # Land exactly on the end point
+    return points
+
+
+def parse_svg_path(d, samples_per_curve=32):
+    """Flattens SVG path data into a list of (N, 2) vertex arrays, one per subpath."""
+    tokens = _tokenize_svg_path(d)
+    polygons, current = [], []
+    position = np.zeros(2)
+    subpath_start = np.zeros(2)
+    last_control, last_command = None, None
+    index, command = 0, None
+
+    while index < len(tokens):
+        if isinstance(tokens[index], str):
+            command = tokens[index]
+            index += 1
+        elif command is None:
+            raise ValueError("SVG path data must start with a command")
+        upper, relative = command.upper(), command.islower()
+        count = _SVG_ARG_COUNTS[upper]
+        args = np.array(tokens[index:index + count], dtype=float)
+        if len(args) != count or any(isinstance(token, str) for token in tokens[index:index + count]):
+            raise ValueError(f"SVG path command {command} needs {count} numbers")
+        index += count
+        origin = position if relative else np.zeros(2)
+
+        if upper == "M":
+            if len(current) > 1:
+                polygons.append(np.array(current))
+            position = origin + args
+            subpath_start = position
+            current = [position]
+            command = "l" if relative else "L"  # Further coordinate pairs are line-tos
+        elif upper == "Z":
+            if len(current) > 1:
+                polygons.append(np.array(current))
+            current = []
+            position = subpath_start
+        else:
+            if not current:
+                current = [position]
+            if upper == "L":
+                new_points = (origin + args)[None, :]
+            elif upper == "H":
+                new_points = np.array([[args[0] + (position[0] if relative else 0), position[1]]])
+            elif upper == "V":
+                new_points = np.array([[position[0], args[0] + (position[1] if relative else 0)]])
+            elif upper in "CS":
+                controls = origin + args.reshape(-1, 2)
+                if upper == "S":  # First control point reflects the previous cubic's second one
+                    first = 2 * position - last_control if last_command in ("C", "S") else position
+                    controls = np.vstack((first, controls))
+                new_points = _bezier(np.vstack((position, controls)), samples_per_curve)
+                last_control = controls[-2]
+            elif upper in "QT":
+                if upper == "Q":
+                    controls = origin + args.reshape(-1, 2)
+                else:  # Control point reflects the previous quadratic's
+                    control = 2 * position - last_control if last_command in ("Q", "T") else position
+                    controls = np.vstack((control, origin + args))
+                new_points = _bezier(np.vstack((position, controls)), samples_per_curve)
+                last_control = controls[0]
+            else:  # "A"
+                new_points = _arc(position, args[0], args[1], args[2], bool(args[3]), bool(args[4]),
+                                  origin + args[5:7], samples_per_curve)
+            current.extend(new_points)
+            position = new_points[-1]
+        last_command = upper
+
+    if len(current) > 1:
+        polygons.append(np.array(current))
+    return polygons
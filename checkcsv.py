@@ -1,17 +1,7 @@
-import csv
 import turtle
 import math
 
-# Function to read points from the CSV file
-def read_points_from_csv(filename="ellipse_points.csv"):
-    points = []
-    with open(filename, mode="r") as file:
-        reader = csv.reader(file)
-        next(reader)  # Skip the header row
-        for row in reader:
-            # Append each row (X, Y) to the points list as a tuple
-            points.append((float(row[0]), float(row[1])))
-    return points
+from pointpyramid import load_pyramid
 
 # Function to calculate scaling factors based on the point's min and max values
 def calculate_scaling_factor(points, width, height):
@@ -81,12 +71,15 @@ def plot_points_with_turtle(points, scale, min_x, min_y, max_x, max_y, width, he
 
 # Main function
 def main():
-    # Read points from the CSV file
-    points = read_points_from_csv("ellipse_points.csv")
-
     # Set up the window size to 300x300
     window_width = 300
     window_height = 300
+
+    # Read the pyramid level that fits the window (about one point per 4x4 pixels)
+    pyramid = load_pyramid("ellipse_points.csv")
+    min_x, max_x, min_y, max_y = pyramid.bounds
+    level = pyramid.choose_level(min_x, max_x, min_y, max_y, window_width * window_height // 16)
+    points = list(zip(*(values.tolist() for values in pyramid.levels[level])))
     turtle.setup(window_width, window_height)
 
     # Calculate scaling factor based on the points
@@ -105,4 +98,5 @@ def main():
     turtle.done()
 
 # Run the script
-main()
+if __name__ == "__main__":
+    main()
@@ -1,67 +1,69 @@
-import csv
 import matplotlib.pyplot as plt
+from matplotlib.colors import LinearSegmentedColormap
 import numpy as np
 import math
 
-# Function to read points from the CSV file
-def read_points_from_csv(filename="ellipse_points.csv"):
-    points = []
-    with open(filename, mode="r") as file:
-        reader = csv.reader(file)
-        next(reader)  # Skip the header row
-        for row in reader:
-            # Append each row (X, Y) to the points list as a tuple
-            points.append((float(row[0]), float(row[1])))
-    return points
-
-# Function to calculate the distance from the origin (0,0)
-def calculate_distance_from_origin(x, y):
-    return math.sqrt(x**2 + y**2)
-
-# Function to calculate colors based on distance
-def calculate_color(distance, max_distance):
-    # Normalize the distance to a value between 0 and 1
-    normalized_distance = distance / max_distance
-    # Map normalized distance to RGB values (Red → Green → Blue)
-    red = max(0, 1 - normalized_distance)  # Closer = more red
-    green = 0  # Green remains 0, as we want a red-to-blue gradient
-    blue = min(1, normalized_distance)  # Farther = more blue
-    return red, green, blue
+from pointpyramid import load_pyramid
 
 # Function to calculate Euclidean distance between two points
 def calculate_euclidean_distance(p1, p2):
     return math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
 
+# Function to pick how many points to draw for the current axes size
+def point_budget(ax, pixels_per_point=16):
+    bbox = ax.get_window_extent()
+    return max(2000, int(bbox.width * bbox.height / pixels_per_point))
+
 # Function to plot points with Matplotlib
-def plot_points_with_matplotlib(points):
-    # Calculate the distance of each point from the origin
-    distances = [calculate_distance_from_origin(x, y) for x, y in points]
-    
-    # Find the maximum distance to normalize the color scale
-    max_distance = max(distances)
-    
-    # Create an array of colors based on the distance
-    colors = [calculate_color(dist, max_distance) for dist in distances]
-    
-    # Extract x and y coordinates for plotting
-    x_vals = [x for x, y in points]
-    y_vals = [y for x, y in points]
-    
-    # Plot the points with the calculated colors
-    plt.scatter(x_vals, y_vals, c=colors, s=10)  # 's' controls the size of the points
-    
-    # Plot lines between consecutive points (with a very thin line)
-    for i in range(1, len(points)):
-        plt.plot([x_vals[i-1], x_vals[i]], [y_vals[i-1], y_vals[i]], color='gray', linewidth=0.5)
+def plot_points_with_matplotlib(pyramid):
+    # Red (near the origin) to blue (far away), the same gradient as checkcsv.calculate_color
+    red_to_blue = LinearSegmentedColormap.from_list("red_to_blue", [(1, 0, 0), (0, 0, 1)])
+    full_x, full_y = pyramid.levels[0]
+    max_distance = np.max(np.hypot(full_x, full_y)) or 1.0
+
+    fig, ax = plt.subplots()
+    # One line and one scatter artist, refilled from the pyramid on every zoom or pan
+    line, = ax.plot([], [], color='gray', linewidth=0.5)
+    scatter = ax.scatter([], [], c=[], s=10, cmap=red_to_blue, vmin=0, vmax=max_distance)
+
+    min_x, max_x, min_y, max_y = pyramid.bounds
+    margin_x, margin_y = (max_x - min_x) * 0.05 or 1, (max_y - min_y) * 0.05 or 1
+    ax.set_xlim(min_x - margin_x, max_x + margin_x)
+    ax.set_ylim(min_y - margin_y, max_y + margin_y)
+
+    # Limits of the last query, so a repeated limits callback does not query again
+    last_view = [None]
+
+    # Function to redraw the level of detail that fits the visible region
+    def update_view(_=None):
+        x0, x1 = sorted(ax.get_xlim())
+        y0, y1 = sorted(ax.get_ylim())
+        budget = point_budget(ax)
+        if last_view[0] == (x0, x1, y0, y1, budget):
+            return
+        last_view[0] = (x0, x1, y0, y1, budget)
+        level = pyramid.choose_level(x0, x1, y0, y1, budget)
+        x_vals, y_vals, _ = pyramid.query(level, x0, x1, y0, y1)
+        line.set_data(x_vals, y_vals)
+        valid = ~np.isnan(x_vals)
+        scatter.set_offsets(np.column_stack((x_vals[valid], y_vals[valid])))
+        scatter.set_array(np.hypot(x_vals[valid], y_vals[valid]))
+        fig.canvas.draw_idle()
+
+    update_view()
+    # An x-only or y-only zoom sets just one of the limits, so listen to both;
+    # callbacks that leave the view as last queried are skipped
+    ax.callbacks.connect('xlim_changed', update_view)
+    ax.callbacks.connect('ylim_changed', update_view)
     
     # Add lines on the x and y axes
-    plt.axhline(0, color='black', linewidth=1)  # Horizontal line at y=0
-    plt.axvline(0, color='black', linewidth=1)  # Vertical line at x=0
+    ax.axhline(0, color='black', linewidth=1)  # Horizontal line at y=0
+    ax.axvline(0, color='black', linewidth=1)  # Vertical line at x=0
     
-    plt.title("Points with Distance-Based Color Gradient and Connecting Lines")
-    plt.xlabel("X")
-    plt.ylabel("Y")
-    plt.colorbar()  # Show a color bar
+    ax.set_title("Points with Distance-Based Color Gradient and Connecting Lines")
+    ax.set_xlabel("X")
+    ax.set_ylabel("Y")
+    fig.colorbar(scatter, ax=ax)  # Show a color bar
 
     # Store the clicked points
     clicked_points = []
@@ -69,8 +71,12 @@ def plot_points_with_matplotlib(points):
     # Function to handle mouse click event
     def on_click(event):
         # Only capture clicks inside the plot area
-        if event.inaxes:
-            clicked_points.append((event.xdata, event.ydata))
+        if event.inaxes is ax:
+            # Snap to the nearest full-resolution point within a few pixels of the click
+            x0, x1 = ax.get_xlim()
+            snap_radius = 5 * abs(x1 - x0) / ax.get_window_extent().width
+            snapped = pyramid.nearest(event.xdata, event.ydata, snap_radius)
+            clicked_points.append(snapped if snapped is not None else (event.xdata, event.ydata))
             if len(clicked_points) == 2:
                 # Calculate distance between two clicked points
                 p1, p2 = clicked_points
@@ -80,17 +86,18 @@ def plot_points_with_matplotlib(points):
                 clicked_points.clear()  # Reset after displaying the distance
 
     # Connect the click event to the function
-    plt.gcf().canvas.mpl_connect('button_press_event', on_click)
+    fig.canvas.mpl_connect('button_press_event', on_click)
 
     plt.show()
 
 # Main function
 def main():
-    # Read points from the CSV file
-    points = read_points_from_csv("ellipse_points.csv")
+    # Load (or build and cache) the multi-resolution pyramid of the CSV points
+    pyramid = load_pyramid("ellipse_points.csv")
     
     # Plot the points using Matplotlib with the color gradient and lines between points
-    plot_points_with_matplotlib(points)
+    plot_points_with_matplotlib(pyramid)
 
 # Run the script
-main()
+if __name__ == "__main__":
+    main()
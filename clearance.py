@@ -0,0 +1,135 @@
+import numpy as np
+
+# Neighbouring cells searched around each point's own cell
+_NEIGHBOUR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+
+# -------------------------------
+# 1. Point-to-Segment Distance
+# -------------------------------
+def point_segment_distance(px, py, x0, y0, x1, y1):
+    """Vectorized distance from points (px, py) to segments (x0, y0)-(x1, y1)."""
+    dx, dy = x1 - x0, y1 - y0
+    length_sq = dx * dx + dy * dy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(length_sq > 0, ((px - x0) * dx + (py - y0) * dy) / length_sq, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+    return np.hypot(px - (x0 + t * dx), py - (y0 + t * dy))
+
+
+# -------------------------------
+# 2. Spatial-Hash Clearance
+# -------------------------------
+def path_clearance(x, y, turn, search_radius, min_turn_gap=0.5, chunk_size=50_000):
+    """
+    For every vertex of a spiral path, returns the distance to the nearest
+    part of the path that is at least min_turn_gap turns away (its
+    neighbouring rings), or inf if nothing is within search_radius.
+
+    Segments are bucketed in a spatial hash by their midpoints, with cells
+    search_radius plus half the longest segment wide, so every segment that
+    can be within reach of a vertex sits in one of the 3x3 cells around it.
+    Building the hash is a sort and each lookup a binary search, so the
+    check is O(n log n) plus the number of nearby candidates, not O(n^2).
+    turn is the spiral's turn parameter at each vertex (increasing).
+    """
+    x, y, turn = (np.asarray(v, dtype=float) for v in (x, y, turn))
+    x0, y0, x1, y1 = x[:-1], y[:-1], x[1:], y[1:]
+    turn0, turn1 = turn[:-1], turn[1:]
+
+    cell = search_radius + np.max(np.hypot(x1 - x0, y1 - y0)) / 2
+    mid_x, mid_y = (x0 + x1) / 2, (y0 + y1) / 2
+    min_x, min_y = x.min(), y.min()
+    cells_y = int((y.max() - min_y) // cell) + 1
+    cells_x = int((x.max() - min_x) // cell) + 1
+
+    # Hash each segment by the cell of its midpoint, sorted for binary search
+    segment_keys = (((mid_x - min_x) // cell).astype(np.int64) * cells_y
+                    + ((mid_y - min_y) // cell).astype(np.int64))
+    order = np.argsort(segment_keys, kind="stable")
+    sorted_keys = segment_keys[order]
+
+    clearance = np.full(len(x), np.inf)
+    for start in range(0, len(x), chunk_size):
+        stop = min(start + chunk_size, len(x))
+        px, py, pturn = x[start:stop], y[start:stop], turn[start:stop]
+        cell_x = ((px - min_x) // cell).astype(np.int64)
+        cell_y = ((py - min_y) // cell).astype(np.int64)
+
+        for dx, dy in _NEIGHBOUR_OFFSETS:
+            nx, ny = cell_x + dx, cell_y + dy
+            valid = (nx >= 0) & (nx < cells_x) & (ny >= 0) & (ny < cells_y)
+            keys = nx * cells_y + ny
+            low = np.searchsorted(sorted_keys, keys, side="left")
+            counts = np.where(valid, np.searchsorted(sorted_keys, keys, side="right") - low, 0)
+            if not counts.any():
+                continue
+
+            # Expand every (point, candidate segment) pair in this neighbour cell
+            point_index = np.repeat(np.arange(stop - start), counts)
+            run_start = np.repeat(np.cumsum(counts) - counts, counts)
+            segment = order[np.arange(counts.sum()) - run_start + np.repeat(low, counts)]
+
+            # Skip the point's own stretch of path
+            point_turn = pturn[point_index]
+            gap = np.minimum(np.abs(point_turn - turn0[segment]), np.abs(point_turn - turn1[segment]))
+            keep = gap >= min_turn_gap
+            point_index, segment = point_index[keep], segment[keep]
+
+            distance = point_segment_distance(px[point_index], py[point_index],
+                                              x0[segment], y0[segment], x1[segment], y1[segment])
+            distance[distance > search_radius] = np.inf
+            np.minimum.at(clearance[start:stop], point_index, distance)
+
+    return clearance
+
+
+# -------------------------------
+# 3. Ring Clearance Report
+# -------------------------------
+def find_clearance_violations(x, y, turn, threshold):
+    """
+    Returns one entry per ring whose clearance to its neighbours falls below
+    threshold: (ring, x, y, clearance, shortfall) at the ring's tightest point.
+    """
+    turn = np.asarray(turn, dtype=float)
+    clearance = path_clearance(x, y, turn, threshold)
+    ring = np.minimum(np.floor(turn).astype(int), max(int(np.ceil(turn.max())) - 1, 0))
+
+    violations = []
+    for r in np.unique(ring[clearance < threshold]):
+        first, last = np.searchsorted(ring, r, side="left"), np.searchsorted(ring, r, side="right")
+        worst = first + np.argmin(clearance[first:last])
+        violations.append((int(r), float(x[worst]), float(y[worst]),
+                           float(clearance[worst]), float(threshold - clearance[worst])))
+    return violations
+
+
+def check_rings_clearance(rings, threshold):
+    """
+    Returns the clearance violations of a spiral given ring by ring as a list
+    of (x, y) arrays, the way the nested-ellipse scripts build it. A spiral
+    with no rings (or a single point) has no neighbours, so nothing is reported.
+    """
+    if sum(len(ring_x) for ring_x, _ in rings) < 2:
+        return []
+    x = np.concatenate([ring_x for ring_x, _ in rings])
+    y = np.concatenate([ring_y for _, ring_y in rings])
+    turn = np.concatenate([index + np.linspace(0, 1, len(ring_x)) for index, (ring_x, _) in enumerate(rings)])
+    return find_clearance_violations(x, y, turn, threshold)
+
+
+def check_spiral_clearance(spiral, threshold, num_points_per_ring=2000):
+    """Samples a ScarfSpiral and returns its clearance violations."""
+    x, y = spiral.sample(num_points_per_ring)
+    return check_rings_clearance(list(zip(x, y)), threshold)
+
+
+def print_clearance_report(violations, threshold):
+    """Prints where and by how much the ring clearance falls below threshold."""
+    if not violations:
+        print(f"\n✅ Ring clearance is at least {threshold} everywhere")
+        return
+    print(f"\n⚠️ Ring clearance below {threshold} on {len(violations)} ring(s):")
+    for ring, x, y, clearance, shortfall in violations:
+        print(f"  ring {ring}: {clearance:.3f} at ({x:.2f}, {y:.2f}), {shortfall:.3f} too close")
@@ -1,16 +1,15 @@
 import turtle
-import math
 import csv
 
+import numpy as np
+
+from ellipsemath import ellipse_angle_at_arc_length, ellipse_perimeter
+
 # Define max canvas size
 CANVAS_WIDTH = 500
 CANVAS_HEIGHT = 500
 MARGIN = 50  # Margin for tick marks and labels
 
-# Function to approximate the perimeter of an ellipse (Ramanujan’s formula)
-def ellipse_perimeter(a, b):
-    return math.pi * (3 * (a + b) - math.sqrt((3 * a + b) * (a + 3 * b)))
-
 # Function to determine spacing based on ellipse size
 def compute_point_spacing(a, b):
     max_dim = max(a, b)
@@ -18,30 +17,17 @@ def compute_point_spacing(a, b):
 
 # Function to generate evenly spaced points along the ellipse
 def generate_ellipse_points(a, b, scale):
-    perimeter = ellipse_perimeter(a, b) * scale  # Scaled perimeter
+    perimeter = ellipse_perimeter(a, b) * scale  # Scaled perimeter (exact, AGM)
     spacing = compute_point_spacing(a, b) * scale  # Adjust spacing based on size
     num_points = max(10, int(perimeter / spacing))  # Adjust points based on new spacing
-    points = []
-
-    arc_length = 0  # Track total arc length
-    prev_x, prev_y = scale * a, 0  # Start at (a, 0)
-
-    for i in range(num_points):
-        t = i / num_points * 2 * math.pi  # Approximate equal spacing using angle
-        x = scale * a * math.cos(t)
-        y = scale * b * math.sin(t)
-
-        # Calculate distance from the previous point
-        segment_length = math.sqrt((x - prev_x) ** 2 + (y - prev_y) ** 2)
-        arc_length += segment_length
 
-        # Only add points that maintain uniform arc length
-        if arc_length >= spacing:
-            points.append((x, y))
-            prev_x, prev_y = x, y
-            arc_length = 0  # Reset arc length tracker
+    # Angles at exactly equal arc-length steps around the ellipse
+    arc_lengths = np.arange(num_points) * (perimeter / scale / num_points)
+    t = ellipse_angle_at_arc_length(a, b, arc_lengths)
+    x = scale * a * np.cos(t)
+    y = scale * b * np.sin(t)
 
-    return points
+    return list(zip(x.tolist(), y.tolist()))
 
 # Function to draw the ellipse
 def draw_ellipse(a, b, scale):
@@ -0,0 +1,297 @@
+import csv
+
+import numpy as np
+
+from scarfspiral import ScarfSpiral
+
+# Machine settings (mm and mm/min)
+FEED_RATE = 1500       # Cutting / plotting feed
+PLUNGE_RATE = 300      # Tool down feed
+RAPID_RATE = 6000      # Rapid travel, used for the time estimate
+SAFE_Z = 5.0           # Travel height
+CUT_Z = 0.0            # Cutting / pen-down height
+ARC_TOLERANCE = 0.01   # Max deviation of fitted lines and arcs from the points
+
+
+# -------------------------------
+# 1. Line and Arc Fitting
+# -------------------------------
+def _circle_through(x0, y0, x1, y1, x2, y2):
+    """Centre and radius of the circle through three points, or None if they are collinear."""
+    d = 2 * (x0 * (y1 - y2) + x1 * (y2 - y0) + x2 * (y0 - y1))
+    if abs(d) < 1e-12:
+        return None
+    s0, s1, s2 = x0 * x0 + y0 * y0, x1 * x1 + y1 * y1, x2 * x2 + y2 * y2
+    cx = (s0 * (y1 - y2) + s1 * (y2 - y0) + s2 * (y0 - y1)) / d
+    cy = (s0 * (x2 - x1) + s1 * (x0 - x2) + s2 * (x1 - x0)) / d
+    return cx, cy, np.hypot(x0 - cx, y0 - cy)
+
+
+def _fit_move(x, y, i, j, tolerance):
+    """
+    Tries to replace points i..j with one move. Returns ("G1",) for a straight
+    line, ("G2"|"G3", cx, cy, radius, sweep) for an arc, or None.
+    """
+    px, py = x[i:j + 1], y[i:j + 1]
+    dx, dy = px[-1] - px[0], py[-1] - py[0]
+    chord = np.hypot(dx, dy)
+    if j - i < 2:
+        return ("G1",)
+    if chord > 0 and np.max(np.abs((px - px[0]) * dy - (py - py[0]) * dx)) / chord <= tolerance:
+        # Collinear is not enough: the points must also run forwards along the chord,
+        # or a path that doubles back would collapse into one shorter line
+        along = ((px - px[0]) * dx + (py - py[0]) * dy) / chord
+        if np.all(np.diff(along) >= 0) and along.min() >= -tolerance and along.max() <= chord + tolerance:
+            return ("G1",)
+
+    m = (i + j) // 2
+    circle = _circle_through(x[i], y[i], x[m], y[m], x[j], y[j])
+    if circle is None:
+        return None
+    cx, cy, radius = circle
+    if np.max(np.abs(np.hypot(px - cx, py - cy) - radius)) > tolerance:
+        return None
+
+    # Points must sweep monotonically around the centre, less than a full turn
+    ux, uy = px - cx, py - cy
+    steps = np.arctan2(ux[:-1] * uy[1:] - uy[:-1] * ux[1:], ux[:-1] * ux[1:] + uy[:-1] * uy[1:])
+    if not (np.all(steps > 0) or np.all(steps < 0)):
+        return None
+    sweep = steps.sum()
+    if abs(sweep) >= 2 * np.pi * 0.999:
+        return None
+    return ("G3" if sweep > 0 else "G2", cx, cy, radius, sweep)
+
+
+def fit_moves(x, y, tolerance=ARC_TOLERANCE):
+    """
+    Greedily covers a polyline with the longest G1 lines and G2/G3 arcs that
+    stay within tolerance of its points. The end of each move is found by
+    doubling the span and then binary searching, so a path costs about
+    O(n log n). Yields (end_index, fit) where fit is as in _fit_move.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    last = len(x) - 1
+    i = 0
+    while i < last:
+        good, good_fit = i + 1, ("G1",)
+        step = 2
+        bad = None
+        while True:
+            j = min(i + step, last)
+            fit = _fit_move(x, y, i, j, tolerance)
+            if fit is None:
+                bad = j
+                break
+            good, good_fit = j, fit
+            if j == last:
+                break
+            step *= 2
+        while bad is not None and bad - good > 1:
+            j = (good + bad) // 2
+            fit = _fit_move(x, y, i, j, tolerance)
+            if fit is None:
+                bad = j
+            else:
+                good, good_fit = j, fit
+        yield good, good_fit
+        i = good
+
+
+# -------------------------------
+# 2. Path Ordering
+# -------------------------------
+def order_paths(paths, start=(0.0, 0.0)):
+    """
+    Orders (x, y) paths with a nearest-neighbour tour over their end points,
+    reversing a path when entering from its far end is shorter, to reduce
+    rapid travel between cuts.
+    """
+    paths = list(paths)
+    starts = np.array([(p[0][0], p[1][0]) for p in paths], dtype=float).reshape(-1, 2)
+    ends = np.array([(p[0][-1], p[1][-1]) for p in paths], dtype=float).reshape(-1, 2)
+    remaining = np.ones(len(paths), dtype=bool)
+    position = np.asarray(start, dtype=float)
+    ordered = []
+    for _ in range(len(paths)):
+        to_start = np.where(remaining, np.hypot(*(starts - position).T), np.inf)
+        to_end = np.where(remaining, np.hypot(*(ends - position).T), np.inf)
+        best_start, best_end = np.argmin(to_start), np.argmin(to_end)
+        if to_end[best_end] < to_start[best_start]:
+            x, y = paths[best_end]
+            ordered.append((x[::-1], y[::-1]))
+            remaining[best_end] = False
+            position = starts[best_end]
+        else:
+            ordered.append(paths[best_start])
+            remaining[best_start] = False
+            position = ends[best_start]
+    return ordered
+
+
+# -------------------------------
+# 3. Streaming G-code Writer
+# -------------------------------
+class GcodeWriter:
+    """
+    Writes paths as G-code one at a time, fitting G2/G3 arcs where the points
+    allow, and keeps running totals for the cut length, rapid travel and an
+    estimated machine time (feed moves at FEED_RATE, travel at RAPID_RATE,
+    acceleration ignored).
+    """
+
+    def __init__(self, file, feed_rate=FEED_RATE, plunge_rate=PLUNGE_RATE, rapid_rate=RAPID_RATE,
+                 safe_z=SAFE_Z, cut_z=CUT_Z, tolerance=ARC_TOLERANCE, decimals=4):
+        self.file = file
+        self.feed_rate = feed_rate
+        self.plunge_rate = plunge_rate
+        self.rapid_rate = rapid_rate
+        self.safe_z = safe_z
+        self.cut_z = cut_z
+        self.tolerance = tolerance
+        self.decimals = decimals
+        self.position = None
+        self.tool_down = False
+        self.cut_length = 0.0
+        self.plunge_length = 0.0
+        self.rapid_length = 0.0
+        self.line_count = 0
+        self.move_counts = {"G1": 0, "G2": 0, "G3": 0}
+
+    def _emit(self, line):
+        self.file.write(line + "\n")
+        self.line_count += 1
+
+    def _num(self, value):
+        return f"{value:.{self.decimals}f}"
+
+    def header(self):
+        self._emit("G21 ; millimetres")
+        self._emit("G90 ; absolute coordinates")
+        self._emit("G17 ; XY plane")
+        self._emit(f"G0 Z{self._num(self.safe_z)}")
+        self.rapid_length += abs(self.safe_z - self.cut_z)
+
+    def footer(self):
+        self._lift()
+        self._emit("M2")
+
+    def _lift(self):
+        if self.tool_down:
+            self._emit(f"G0 Z{self._num(self.safe_z)}")
+            self.rapid_length += abs(self.safe_z - self.cut_z)
+            self.tool_down = False
+
+    def write_path(self, x, y):
+        """Cuts one (x, y) path, travelling to its start first unless already there."""
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if len(x) < 2:
+            return
+
+        start = np.array([x[0], y[0]])
+        if self.position is None or np.hypot(*(start - self.position)) > self.tolerance:
+            self._lift()
+            if self.position is not None:
+                self.rapid_length += np.hypot(*(start - self.position))
+            self._emit(f"G0 X{self._num(x[0])} Y{self._num(y[0])}")
+        if not self.tool_down:
+            self._emit(f"G1 Z{self._num(self.cut_z)} F{self._num(self.plunge_rate)}")
+            self.plunge_length += abs(self.safe_z - self.cut_z)
+            self._emit(f"F{self._num(self.feed_rate)}")
+            self.tool_down = True
+
+        i = 0
+        for j, fit in fit_moves(x, y, self.tolerance):
+            if fit[0] == "G1":
+                self._emit(f"G1 X{self._num(x[j])} Y{self._num(y[j])}")
+                self.cut_length += np.hypot(x[j] - x[i], y[j] - y[i])
+            else:
+                kind, cx, cy, radius, sweep = fit
+                self._emit(f"{kind} X{self._num(x[j])} Y{self._num(y[j])} "
+                           f"I{self._num(cx - x[i])} J{self._num(cy - y[i])}")
+                self.cut_length += radius * abs(sweep)
+            self.move_counts[fit[0]] += 1
+            i = j
+        self.position = np.array([x[-1], y[-1]])
+
+    @property
+    def estimated_minutes(self):
+        return (self.cut_length / self.feed_rate + self.plunge_length / self.plunge_rate
+                + self.rapid_length / self.rapid_rate)
+
+    def summary(self):
+        """Returns the run totals as a dict."""
+        return {
+            "lines": self.line_count,
+            "moves": dict(self.move_counts),
+            "cut_length": self.cut_length,
+            "rapid_length": self.rapid_length,
+            "estimated_minutes": self.estimated_minutes,
+        }
+
+
+# -------------------------------
+# 4. Export Functions
+# -------------------------------
+def export_gcode(paths, filename, order=False, **writer_options):
+    """
+    Writes (x, y) paths to a G-code file and returns the run summary. Paths are
+    streamed as they arrive unless order=True, which collects them first to
+    minimise rapid travel.
+    """
+    if order:
+        paths = order_paths(paths)
+    with open(filename, mode="w", newline="") as file:
+        writer = GcodeWriter(file, **writer_options)
+        writer.header()
+        for x, y in paths:
+            writer.write_path(x, y)
+        writer.footer()
+    return writer.summary()
+
+
+def export_spiral_gcode(spiral, filename, num_points_per_ring=2000, y_offset=0.0, **writer_options):
+    """Streams a ScarfSpiral to G-code ring by ring; rings join end to end, so there is no travel."""
+    rings = ((x, y + y_offset) for x, y in spiral.iter_rings(num_points_per_ring))
+    return export_gcode(rings, filename, **writer_options)
+
+
+def read_points_from_csv(filename="ellipse_points.csv"):
+    """Reads flat X,Y points (e.g. ellipse_points.csv) as one path."""
+    xs, ys = [], []
+    with open(filename, mode="r") as file:
+        reader = csv.reader(file)
+        next(reader)  # Skip header row
+        for row in reader:
+            xs.append(float(row[0]))
+            ys.append(float(row[1]))
+    return np.array(xs), np.array(ys)
+
+
+def print_summary(summary, filename):
+    moves = summary["moves"]
+    print(f"G-code written to {filename}: {summary['lines']} lines "
+          f"({moves['G1']} G1, {moves['G2'] + moves['G3']} G2/G3)")
+    print(f"Cut length: {summary['cut_length']:.1f} mm, rapid travel: {summary['rapid_length']:.1f} mm")
+    print(f"Estimated machine time: {summary['estimated_minutes']:.1f} min")
+
+
+# -------------------------------
+# 5. Main Function
+# -------------------------------
+def main():
+    source = "csv"  # "csv" for the flat sticker points, "spiral" to stream straight from the generator
+
+    if source == "spiral":
+        # Same parameters as spiraleclipSPACINGEQUALPOINT.py
+        a, b, spacing = 60, 2, 10
+        spiral = ScarfSpiral.from_bbox(a, b, spacing, a * 21, b * 21)
+        summary = export_spiral_gcode(spiral, "spiral.gcode", y_offset=25 * spacing / 100)
+        print_summary(summary, "spiral.gcode")
+    else:
+        x, y = read_points_from_csv("ellipse_points.csv")
+        summary = export_gcode([(x, y)], "ellipse_points.gcode")
+        print_summary(summary, "ellipse_points.gcode")
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import csv
 
+from spiralplot import plot_rings_as_collection
+
 # Function to generate evenly spaced points along an ellipse
 def generate_ellipse_points(a, b, num_points):
     t = np.linspace(0, 2 * np.pi, num_points)  # Parameter t
@@ -29,7 +31,7 @@ def write_points_to_csv(points, csv_point_reduction_factor, spacing, y_offset_pe
     print(f"\n✅ Total points saved to CSV: {total_saved_points}")
 
 # Function to generate nested ellipses with scarf joints
-def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage):
+def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage, single_artist=False):
     num_points_per_ellipse = 2000  # Increased resolution of ellipses
     current_a, current_b = a, b
     prev_x, prev_y = generate_ellipse_points(current_a, current_b, num_points_per_ellipse)
@@ -69,7 +71,8 @@ def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_
         t = np.linspace(0, 1, len(x))
         x_scarf = (1 - t) * prev_x + t * x  # Interpolate x
         y_scarf = (1 - t) * prev_y + t * y  # Interpolate y
-        ax.plot(x_scarf, y_scarf + y_offset, label=f'a={current_a:.1f}, b={current_b:.1f}')  # Apply Y-axis offset
+        if not single_artist:
+            ax.plot(x_scarf, y_scarf + y_offset, label=f'a={current_a:.1f}, b={current_b:.1f}')  # Apply Y-axis offset
         
         # Store generated ellipses for CSV
         generated_ellipses.append((x_scarf, y_scarf))
@@ -77,6 +80,10 @@ def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_
         # Update previous ellipse
         last_x, last_y = prev_x, prev_y
         prev_x, prev_y = x, y
+
+    # All rings as one colormapped artist, with a ring-index colorbar instead of legend entries
+    if single_artist:
+        plot_rings_as_collection(ax, generated_ellipses, y_offset)
     
     return generated_ellipses
 
@@ -89,6 +96,7 @@ def main():
     bbox_b = b * 21  # Bounding ellipse semi-minor axis
     csv_point_reduction_factor = 10  # Adjust how many points are saved in CSV
     y_offset_percentage = 25  # Percentage to move the diagram up (e.g., 30%)
+    single_artist = True  # Draw all rings as one line collection with a ring colorbar (False = one line per ring)
 
     # Set up the plot with full-screen size
     fig, ax = plt.subplots(figsize=(22, 22))  # Maximize figure size
@@ -97,7 +105,8 @@ def main():
     ax.set_aspect('equal', 'box')
 
     # Generate ellipses
-    generated_ellipses = draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage)
+    generated_ellipses = draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage,
+                                                         single_artist)
 
     # Write points to CSV (excluding bounding ellipse)
     write_points_to_csv(generated_ellipses, csv_point_reduction_factor, spacing, y_offset_percentage)
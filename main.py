@@ -1,19 +1,194 @@
+import argparse
+import os
 import subprocess
+import tempfile
+import time
 
-def run_script(script_name):
+from stagecache import (DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, StageCache, hash_file, hash_modules,
+                        local_dependencies, read_module_record, traced_command)
+
+# Pipeline stages in run (topological) order. Each stage's parameters live in
+# its script, so the script's own hash stands in for them in the cache key.
+# A cached entry also records the local modules the run actually imported, and
+# only hits while they are unchanged: the spiral imports 3dmodelwrappy.py only
+# in stream mode, so editing the wrap parameters does not regenerate it.
+# Inputs and outputs form the dependency graph: points feed mapping, mapping
+# feeds distances, and distances feed the viewer. Outputs list every file a
+# stage can write; the cache stores the ones a run actually wrote.
+STAGES = [
+    {"script": "spiraleclipSPACINGEQUALPOINT.py", "inputs": [],
+     "outputs": ["ellipse_points.csv", "sticker_coordinates.csv"]},  # Stream mode also writes the sticker
+    {"script": "3dmodelwrappy.py", "inputs": ["ellipse_points.csv"], "outputs": ["sticker_coordinates.csv"]},
+    {"script": "csvdistances.py", "inputs": ["sticker_coordinates.csv"], "outputs": ["distances_output.csv"]},
+    {"script": "3dcsvplot.py", "inputs": ["sticker_coordinates.csv", "distances_output.csv"],
+     "outputs": []},  # Viewer, always runs
+]
+
+# -------------------------------
+# Running Stages
+# -------------------------------
+def run_script(script_name, module_record=None):
     print(f"Running {script_name}...")
-    result = subprocess.run(['python', script_name], capture_output=True, text=True)
-    
+    # With module_record, the local modules the script imports are written there
+    command = ['python', script_name] if module_record is None else traced_command(script_name, module_record)
+    result = subprocess.run(command, capture_output=True, text=True)
+
     if result.returncode == 0:
         print(f"{script_name} completed successfully.")
     else:
         print(f"Error occurred in {script_name}:\n{result.stderr}")
     print("-" * 40)
+    return result.returncode == 0
+
+def run_stage(stage, cache=None):
+    script_name = stage["script"]
+
+    # Stages without outputs (viewers) are never cached
+    if cache is None or not stage["outputs"]:
+        return run_script(script_name)
+
+    params = {"script": hash_file(script_name), "outputs": stage["outputs"]}
+    key = cache.stage_key(script_name, params, stage["inputs"])
+    if key is not None and cache.restore(key, stage["outputs"]):
+        print(f"{script_name} skipped (outputs restored from cache).")
+        print("-" * 40)
+        return True
+
+    before = file_state(stage["outputs"])
+    with tempfile.TemporaryDirectory() as scratch:
+        record = os.path.join(scratch, "modules.json")
+        success = run_script(script_name, record)
+        modules = read_module_record(record)
+    if success and key is not None and modules is not None:
+        after = file_state(stage["outputs"])
+        cache.store(key, [f for f in stage["outputs"] if after[f] is not None and after[f] != before[f]],
+                    hash_modules(modules))
+    return success
+
+def run_pipeline(stages, cache=None):
+    for stage in stages:
+        if not run_stage(stage, cache):
+            break  # Downstream stages would read stale or missing inputs
+
+# -------------------------------
+# Watch Mode
+# -------------------------------
+def file_state(filenames):
+    """Returns {filename: (mtime_ns, size)}, or None for files that do not exist."""
+    state = {}
+    for filename in filenames:
+        try:
+            info = os.stat(filename)
+            state[filename] = (info.st_mtime_ns, info.st_size)
+        except FileNotFoundError:
+            state[filename] = None
+    return state
+
+def stage_dependencies(stages=STAGES, previous=None):
+    """
+    Maps each stage script to the local modules it imports, as paths relative
+    to the working directory. A script (or module) that is missing or does
+    not parse mid-edit keeps its `previous` list.
+    """
+    dependencies = {}
+    for stage in stages:
+        try:
+            paths = local_dependencies(stage["script"])
+        except (OSError, SyntaxError, ValueError):
+            dependencies[stage["script"]] = (previous or {}).get(stage["script"], [])
+        else:
+            dependencies[stage["script"]] = [os.path.relpath(path) for path in paths]
+    return dependencies
+
+def affected_stages(changed_files, stages=STAGES, dependencies=None):
+    """
+    Returns the stages whose script or inputs changed, plus everything
+    downstream of them. A change to a local module listed for a script in
+    `dependencies` (see stage_dependencies) counts as a change to that script.
+    """
+    dirty_files = set(changed_files)
+    dependencies = dependencies or {}
+    affected = []
+    for stage in stages:
+        script_changed = stage["script"] in dirty_files or dirty_files.intersection(
+            dependencies.get(stage["script"], []))
+        if script_changed or dirty_files.intersection(stage["inputs"]):
+            affected.append(stage)
+            dirty_files.update(stage["outputs"])
+    return affected
+
+def watched_files(stages, dependencies):
+    """Every script, local module, input and output the stages depend on."""
+    return sorted({f for stage in stages
+                   for f in [stage["script"], *dependencies[stage["script"]], *stage["inputs"], *stage["outputs"]]})
+
+def watch(cache=None, poll_interval=0.5, debounce=1.0, stages=STAGES):
+    """
+    Polls the pipeline's scripts, the local modules they import, their inputs
+    and intermediate files, and re-runs only the stages affected by a change.
+    A burst of writes is collapsed into one run by waiting until the files
+    have been quiet for `debounce` seconds.
+    """
+    dependencies = stage_dependencies(stages)
+    watched = watched_files(stages, dependencies)
+    snapshot = file_state(watched)
+    print(f"Watching {len(watched)} files (Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(poll_interval)
+            current = file_state(watched)
+            if current == snapshot:
+                continue
+
+            # Debounce: wait until nothing has changed for a while
+            quiet_since = time.monotonic()
+            while time.monotonic() - quiet_since < debounce:
+                time.sleep(poll_interval)
+                latest = file_state(watched)
+                if latest != current:
+                    current, quiet_since = latest, time.monotonic()
+
+            changed = [f for f in watched if current[f] != snapshot[f]]
+            stages_to_run = affected_stages(changed, stages, dependencies)
+            print(f"Changed: {', '.join(changed)}")
+            outputs = sorted({f for stage in stages_to_run for f in stage["outputs"]})
+            before = file_state(outputs)
+            run_pipeline(stages_to_run, cache)
+
+            # Keep the state that triggered this run, so edits saved while it ran trigger
+            # the next one; only the outputs the run itself wrote are taken as seen
+            after = file_state(outputs)
+            snapshot = dict(current)
+            snapshot.update({f: after[f] for f in outputs if after[f] != before[f]})
+
+            # An edit may have added or dropped imports, so refresh the watched modules
+            dependencies = stage_dependencies(stages, dependencies)
+            watched = watched_files(stages, dependencies)
+            snapshot.update({f: state for f, state in file_state(watched).items() if f not in snapshot})
+    except KeyboardInterrupt:
+        print("Stopped watching.")
 
 def main():
-    run_script("spiraleclipSPACINGEQUALPOINT.py")
-    run_script("3dmodelwrappy.py")
-    run_script("3dcsvplot.py")
+    parser = argparse.ArgumentParser(description="Run the spiral -> wrap -> distances -> preview pipeline.")
+    parser.add_argument("--watch", action="store_true",
+                        help="Watch pipeline files and re-run only the stages affected by a change")
+    parser.add_argument("--debounce", type=float, default=1.0,
+                        help="Seconds files must stay unchanged before a watch run starts")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-run every stage")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory for cached stage outputs")
+    parser.add_argument("--cache-size-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="Cache size limit before least-recently-used entries are evicted")
+    args = parser.parse_args()
+
+    cache = None
+    if not args.no_cache:
+        cache = StageCache(args.cache_dir, max_bytes=int(args.cache_size_mb * 1024 * 1024))
+
+    if args.watch:
+        watch(cache, debounce=args.debounce)
+    else:
+        run_pipeline(STAGES, cache)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,143 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+WRITE_CHUNK = 1_000_000  # Triangles (or OBJ lines) packed per write, bounding memory for very large meshes
+
+# Binary STL triangle record: normal, three vertices, attribute byte count (50 bytes)
+STL_TRIANGLE = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attributes", "<u2")])
+
+# Corner order of each cross-section of the strip
+_BOTTOM_LEFT, _BOTTOM_RIGHT, _TOP_LEFT, _TOP_RIGHT = range(4)
+
+# Long sides as (corner at start, corner at end) pairs, wound so normals face outwards
+_SIDES = [
+    (_TOP_LEFT, _TOP_RIGHT),        # Top (away from the cylinder)
+    (_BOTTOM_RIGHT, _BOTTOM_LEFT),  # Bottom (on the cylinder)
+    (_BOTTOM_LEFT, _TOP_LEFT),      # Left edge
+    (_TOP_RIGHT, _BOTTOM_RIGHT),    # Right edge
+]
+
+
+# -------------------------------
+# 1. Ribbon Mesh
+# -------------------------------
+def ribbon_mesh(x, y, z, width=1.0, thickness=0.1, cylinder_radius=None):
+    """
+    Extrudes a path wrapped on a cylinder (axis along Y, as produced by
+    3dmodelwrappy.map_points_to_cylinder) into a closed strip of the given
+    width and thickness lying on the cylinder surface.
+
+    Every point gets a rectangular cross-section spanned by the in-surface
+    direction across the path and the cylinder normal; consecutive sections
+    are joined by eight triangles and the ends are capped. Vertices and
+    triangle indices are built as whole arrays. Returns (vertices (4n, 3),
+    triangles (m, 3)).
+    """
+    points = np.column_stack((x, y, z)).astype(float)
+    keep = np.append(True, np.any(np.diff(points, axis=0) != 0, axis=1))  # Repeated points have no direction
+    points = points[keep]
+    if len(points) < 2:
+        raise ValueError("a ribbon needs at least two distinct points")
+
+    radial = np.hypot(points[:, 0], points[:, 2])
+    if cylinder_radius is None:
+        cylinder_radius = float(np.median(radial))
+    normal = np.column_stack((points[:, 0], np.zeros(len(points)), points[:, 2])) / radial[:, None]
+    tangent = np.gradient(points, axis=0)
+    tangent -= normal * np.sum(tangent * normal, axis=1, keepdims=True)  # Keep it in the surface
+    tangent /= np.linalg.norm(tangent, axis=1, keepdims=True)
+    across = np.cross(normal, tangent)
+
+    # Offset across the path, then project back onto the inner and outer cylinders
+    left = points - across * (width / 2)
+    right = points + across * (width / 2)
+    vertices = np.empty((len(points), 4, 3))
+    for corner, base, radius in ((_BOTTOM_LEFT, left, cylinder_radius), (_BOTTOM_RIGHT, right, cylinder_radius),
+                                 (_TOP_LEFT, left, cylinder_radius + thickness),
+                                 (_TOP_RIGHT, right, cylinder_radius + thickness)):
+        scale = radius / np.hypot(base[:, 0], base[:, 2])
+        vertices[:, corner] = np.column_stack((base[:, 0] * scale, base[:, 1], base[:, 2] * scale))
+
+    start = (4 * np.arange(len(points) - 1))[:, None]
+    faces = []
+    for c0, c1 in _SIDES:
+        a, b = start + c0, start + c1
+        c, d = b + 4, a + 4
+        faces.append(np.hstack((a, c, b)))
+        faces.append(np.hstack((a, d, c)))
+    last = 4 * (len(points) - 1)
+    caps = np.array([[_BOTTOM_LEFT, _TOP_LEFT, _TOP_RIGHT], [_BOTTOM_LEFT, _TOP_RIGHT, _BOTTOM_RIGHT],
+                     [_BOTTOM_LEFT, _TOP_RIGHT, _TOP_LEFT], [_BOTTOM_LEFT, _BOTTOM_RIGHT, _TOP_RIGHT]])
+    caps[2:] += last
+    triangles = np.concatenate([np.stack(faces, axis=1).reshape(-1, 3), caps])
+    return vertices.reshape(-1, 3), triangles
+
+
+# -------------------------------
+# 2. Writers
+# -------------------------------
+def write_stl(filename, vertices, triangles, header=b"eclipe sticker ribbon"):
+    """Writes a binary STL (50 bytes per triangle), packing records with a structured dtype in chunks."""
+    vertices = vertices.astype(np.float32)
+    with open(filename, "wb") as file:
+        file.write(header[:80].ljust(80, b"\0"))
+        file.write(np.uint32(len(triangles)).tobytes())
+        for begin in range(0, len(triangles), WRITE_CHUNK):
+            corners = vertices[triangles[begin:begin + WRITE_CHUNK]]
+            normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+            lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+            records = np.zeros(len(corners), dtype=STL_TRIANGLE)
+            records["normal"] = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+            records["vertices"] = corners
+            records.tofile(file)
+
+
+def write_obj(filename, vertices, triangles):
+    """Writes a Wavefront OBJ with shared vertices, formatting whole chunks of lines at once."""
+    with open(filename, "w") as file:
+        file.write("# eclipe sticker ribbon\n")
+        for rows, line in ((vertices, "v %.6f %.6f %.6f\n"), (triangles + 1, "f %d %d %d\n")):  # OBJ counts from 1
+            for begin in range(0, len(rows), WRITE_CHUNK):
+                chunk = rows[begin:begin + WRITE_CHUNK]
+                file.write((line * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+
+def export_mesh(filename, vertices, triangles):
+    """Writes .stl (binary) or .obj depending on the file extension."""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".stl":
+        write_stl(filename, vertices, triangles)
+    elif extension == ".obj":
+        write_obj(filename, vertices, triangles)
+    else:
+        raise ValueError(f"unsupported mesh format {extension!r} (use .stl or .obj)")
+
+
+def read_points_from_csv(filename="sticker_coordinates.csv"):
+    """Reads X, Y, Z columns from a CSV with a header row."""
+    data = np.loadtxt(filename, delimiter=",", skiprows=1, usecols=(0, 1, 2), ndmin=2)
+    return data[:, 0], data[:, 1], data[:, 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the wrapped sticker path as a thin strip mesh.")
+    parser.add_argument("--input", default="sticker_coordinates.csv", help="Wrapped points (X, Y, Z)")
+    parser.add_argument("--output", default="sticker_ribbon.stl", help="Mesh file, .stl (binary) or .obj")
+    parser.add_argument("--width", type=float, default=1.0, help="Strip width across the path")
+    parser.add_argument("--thickness", type=float, default=0.1, help="Strip thickness off the cylinder")
+    parser.add_argument("--radius", type=float, default=None,
+                        help="Cylinder radius (default: estimated from the points)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    x, y, z = read_points_from_csv(args.input)
+    vertices, triangles = ribbon_mesh(x, y, z, args.width, args.thickness, args.radius)
+    export_mesh(args.output, vertices, triangles)
+    print(f"Wrote {len(triangles)} triangles ({len(vertices)} vertices) to {args.output} "
+          f"in {time.perf_counter() - start:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import csv
 
+from scarfspiral import blended_ellipse_points, sample_blended_ellipses
+from spiralplot import plot_rings_as_collection
+
 # Define max canvas size
 CANVAS_WIDTH = 500
 CANVAS_HEIGHT = 500
@@ -32,45 +35,43 @@ def write_points_to_csv(points, filename="ellipse_points.csv"):
                 writer.writerow([x, y])  # Write each point
 
 # Function to generate and draw nested ellipses with scarf joints, ending at (0,0)
-def draw_nested_ellipses_with_scarf(a, b, spacing, ax):
-    current_a, current_b = a, b
-    points_list = []
-    prev_x, prev_y = generate_ellipse_points(current_a, current_b, 500)  # Initial ellipse points
+def draw_nested_ellipses_with_scarf(a, b, spacing, ax, point_spacing=1.0, workers=1, single_artist=False):
+    # Semi-axes of every nested ellipse, shrinking until one axis reaches zero
+    steps = np.arange(1, int(min(a, b) / spacing) + 2)
+    steps = steps[(a - steps * spacing > 0) & (b - steps * spacing > 0)]
+    ring_a = a - steps * spacing
+    ring_b = b - steps * spacing
 
     # Draw the outermost ellipse as a dotted line
-    ax.plot(prev_x, prev_y, 'k--', label="Outermost Ellipse")  # Dotted line for outer ellipse
-
-    # Continue generating ellipses until one axis goes negative
-    while current_a > 0 and current_b > 0:
-        # Reduce semi-axes
-        current_a -= spacing
-        current_b -= spacing
-        if current_a <= 0 or current_b <= 0:
-            break  # Stop when one axis becomes negative
-
-        # Generate points for the current ellipse
-        x, y = generate_ellipse_points(current_a, current_b, 500)
-        points_list.append((x, y))
-
-        # Add scarf joint: interpolate between the previous and current ellipse
-        t = np.linspace(0, 1, len(x))
-        x_scarf = (1 - t) * prev_x + t * x  # Interpolate x
-        y_scarf = (1 - t) * prev_y + t * y  # Interpolate y
-
-        # Plot the current ellipse with the scarf joint transition
-        ax.plot(x_scarf, y_scarf, label=f'a={current_a:.1f}, b={current_b:.1f}')
-
-        # Set the current ellipse as the previous ellipse for the next iteration
-        prev_x, prev_y = x, y
+    outer_x, outer_y = generate_ellipse_points(a, b, 500)
+    ax.plot(outer_x, outer_y, 'k--', label="Outermost Ellipse")  # Dotted line for outer ellipse
+
+    # Scarf joints: interpolate between each previous and current ellipse, all at once
+    prev_a = np.concatenate(([a], ring_a[:-1]))
+    prev_b = np.concatenate(([b], ring_b[:-1]))
+    x_scarf, y_scarf = blended_ellipse_points(prev_a, ring_a, prev_b, ring_b, np.linspace(0, 1, 500))
+    if single_artist:
+        # All rings as one colormapped artist, with a ring-index colorbar instead of legend entries
+        plot_rings_as_collection(ax, zip(x_scarf, y_scarf))
+    else:
+        for i in range(len(ring_a)):
+            ax.plot(x_scarf[i], y_scarf[i], label=f'a={ring_a[i]:.1f}, b={ring_b[i]:.1f}')
 
     # **Ensure the last ellipse ends at (0,0) smoothly**
-    t_final = np.linspace(0, 1, len(prev_x))
-    x_final = (1 - t_final) * prev_x  # Gradually shrink X to 0
-    y_final = (1 - t_final) * prev_y  # Gradually shrink Y to 0
+    last_a = ring_a[-1] if len(ring_a) else a
+    last_b = ring_b[-1] if len(ring_b) else b
+
+    # Sample every ellipse and the final transition to (0,0) in one batch,
+    # with points evenly spaced by arc length across all of them
+    x, y, counts = sample_blended_ellipses(np.append(ring_a, last_a), np.append(ring_a, 0),
+                                           np.append(ring_b, last_b), np.append(ring_b, 0), point_spacing,
+                                           workers=workers)
+    split_at = np.cumsum(counts)[:-1]
+    points_list = list(zip(np.split(x, split_at), np.split(y, split_at)))
 
     # Plot the final transition to (0,0)
+    x_final, y_final = points_list[-1]
     ax.plot(x_final, y_final, 'r', label="Final Transition to (0,0)")
-    points_list.append((x_final, y_final))  # Add to CSV data
 
     return points_list  # Return ellipse points (excluding outermost)
 
@@ -79,6 +80,9 @@ def main():
     a = 50  # Semi-major axis (user-defined)
     b = 100  # Semi-minor axis (user-defined)
     spacing = 5  # Spacing between each nested ellipse
+    point_spacing = 1.0  # Distance between saved points along every ellipse
+    workers = 1  # Processes used to sample the ellipses (1 = serial, None = all cores)
+    single_artist = True  # Draw all rings as one line collection with a ring colorbar (False = one line per ring)
 
     # Compute scaling factor
     scale = compute_scaling_factor(a, b)
@@ -90,7 +94,7 @@ def main():
     ax.set_aspect('equal', 'box')
 
     # Draw nested ellipses inside the large ellipse with scarf joint transition
-    nested_points = draw_nested_ellipses_with_scarf(a, b, spacing, ax)
+    nested_points = draw_nested_ellipses_with_scarf(a, b, spacing, ax, point_spacing, workers, single_artist)
 
     # Write points to CSV (excluding the outermost ellipse)
     write_points_to_csv(nested_points)
@@ -109,4 +113,5 @@ def main():
     plt.show()
 
 # Run the script
-main()
+if __name__ == "__main__":
+    main()
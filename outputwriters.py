@@ -0,0 +1,75 @@
+import queue
+import threading
+
+
+class OutputWriteError(Exception):
+    """Raised by OutputWriterPool.flush() when one or more background writes failed."""
+
+    def __init__(self, failures):
+        self.failures = failures  # List of (description, exception)
+        details = "; ".join(f"{description}: {error!r}" for description, error in failures)
+        super().__init__(f"{len(failures)} output write(s) failed: {details}")
+
+
+class OutputWriterPool:
+    """
+    Runs output writes (CSV, SVG, previews) on background threads so that
+    formatting and disk I/O overlap with the computation that follows.
+
+    Writes go through a bounded queue: submit() blocks once max_pending writes
+    are waiting, which caps the memory held by finished-but-unwritten arrays.
+    flush() is a barrier that waits for every queued write and raises
+    OutputWriteError if any of them failed. Callers must not modify an array
+    after handing it to submit().
+    """
+
+    def __init__(self, workers=2, max_pending=8):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._failures = []
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                func, args, kwargs = job
+                try:
+                    func(*args, **kwargs)
+                except Exception as error:
+                    with self._lock:
+                        self._failures.append((getattr(func, "__name__", repr(func)), error))
+            finally:
+                self._queue.task_done()
+
+    def submit(self, func, *args, **kwargs):
+        """Queues func(*args, **kwargs) for a writer thread; blocks while the queue is full."""
+        self._queue.put((func, args, kwargs))
+
+    def flush(self):
+        """Waits for all queued writes, then raises OutputWriteError if any failed."""
+        self._queue.join()
+        with self._lock:
+            failures, self._failures = self._failures, []
+        if failures:
+            raise OutputWriteError(failures)
+
+    def close(self):
+        """Flushes pending writes and stops the writer threads."""
+        try:
+            self.flush()
+        finally:
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
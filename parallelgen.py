@@ -0,0 +1,64 @@
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# -------------------------------
+# 1. Worker
+# -------------------------------
+def _run_chunk(fill, shm_name, shape, dtype, start, stop, args):
+    """Worker entry point: fills items [start, stop) directly into the shared output array."""
+    shm = shared_memory.SharedMemory(name=shm_name)  # Parent owns and unlinks the block
+    try:
+        out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        fill(out, start, stop, *args)
+        del out  # Release the view before closing the block
+    finally:
+        shm.close()
+
+
+# -------------------------------
+# 2. Parallel Fill
+# -------------------------------
+def fill_in_parallel(fill, shape, total, args=(), workers=1, chunks_per_worker=4, dtype=np.float64):
+    """
+    Builds an array of the given shape by calling fill(out, start, stop, *args)
+    over the work items [0, total), split across a process pool.
+
+    Workers write straight into one shared-memory array, so results are never
+    pickled; only args are sent to each worker. fill must be a module-level
+    function that only writes the part of out belonging to its items, so
+    the serial path (workers=1) runs the very same code and gives identical
+    output. The parallel result is backed by the shared block, which is
+    released once the array and all views of it are gone.
+    """
+    workers = workers or os.cpu_count()
+    if workers <= 1 or total < 2:
+        out = np.empty(shape, dtype=dtype)
+        fill(out, 0, total, *args)
+        return out
+
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+    try:
+        bounds = np.linspace(0, total, min(total, workers * chunks_per_worker) + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_chunk, fill, shm.name, shape, np.dtype(dtype).str, start, stop, args)
+                       for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+            for future in futures:
+                future.result()  # Re-raise any worker error
+    except BaseException:
+        shm.close()
+        raise
+    finally:
+        shm.unlink()  # Only the name goes; the mapping stays valid while this process holds it
+
+    # Return the shared block itself rather than a copy, which would double peak
+    # memory. The finalizer keeps the block open until the array and every view
+    # of it have been garbage collected, then unmaps it.
+    out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    weakref.finalize(out, shm.close)
+    return out
@@ -0,0 +1,150 @@
+import os
+
+import numpy as np
+
+PYRAMID_SUFFIX = ".pyramid.npz"
+GRID_SIZE = 256         # Cells per side of each level's spatial index
+MIN_LEVEL_POINTS = 1024  # Stop halving once a level is this small
+
+
+# -------------------------------
+# 1. Multi-Resolution Point Pyramid
+# -------------------------------
+class PointPyramid:
+    """
+    Decimated copies of a point path (level 0 is full resolution, each level
+    keeps every second point of the one below) with a grid index per level.
+
+    The grid lets a viewer count and fetch the points inside any rectangle in
+    time proportional to the points returned, so it can pick the finest level
+    that fits a point budget for the current view and clip to that view,
+    whatever the size of the file.
+    """
+
+    def __init__(self, levels, bounds, orders, cell_starts):
+        self.levels = levels              # [(x, y), ...] from full resolution to coarsest
+        self.bounds = bounds              # (min_x, max_x, min_y, max_y)
+        self.orders = orders              # Per level: point indices sorted by grid cell
+        self.cell_starts = cell_starts    # Per level: offsets into orders for each cell
+
+    @classmethod
+    def build(cls, x, y, min_level_points=MIN_LEVEL_POINTS):
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        bounds = (x.min(), x.max(), y.min(), y.max())
+        levels = [(x, y)]
+        while len(levels[-1][0]) > min_level_points:
+            level_x, level_y = levels[-1]
+            keep = np.append(np.arange(0, len(level_x) - 1, 2), len(level_x) - 1)  # Keep the end point
+            levels.append((level_x[keep], level_y[keep]))
+
+        orders, cell_starts = [], []
+        for level_x, level_y in levels:
+            keys = _cell_keys(level_x, level_y, bounds)
+            order = np.argsort(keys, kind="stable").astype(np.int64 if len(keys) >= 2**31 else np.int32)
+            orders.append(order)
+            cell_starts.append(np.searchsorted(keys[order], np.arange(GRID_SIZE * GRID_SIZE + 1)))
+        return cls(levels, bounds, orders, cell_starts)
+
+    def _cell_range(self, x0, x1, y0, y1):
+        """Grid columns and row range overlapping a rectangle."""
+        min_x, max_x, min_y, max_y = self.bounds
+        cx0, cx1 = _clip_cell(x0, min_x, max_x), _clip_cell(x1, min_x, max_x)
+        cy0, cy1 = _clip_cell(y0, min_y, max_y), _clip_cell(y1, min_y, max_y)
+        columns = np.arange(cx0, cx1 + 1) * GRID_SIZE
+        return columns + cy0, columns + cy1 + 1
+
+    def count(self, level, x0, x1, y0, y1):
+        """Number of candidate points of a level in the cells covering the rectangle."""
+        first, last = self._cell_range(x0, x1, y0, y1)
+        starts = self.cell_starts[level]
+        return int(np.sum(starts[last] - starts[first]))
+
+    def choose_level(self, x0, x1, y0, y1, budget):
+        """Finest level with at most `budget` points in view (the coarsest level otherwise)."""
+        for level in range(len(self.levels)):
+            if self.count(level, x0, x1, y0, y1) <= budget:
+                return level
+        return len(self.levels) - 1
+
+    def query(self, level, x0, x1, y0, y1):
+        """
+        Returns (x, y, index) of a level's points in the cells covering the
+        rectangle, in path order, with NaN rows inserted where the path leaves
+        the view so lines are not drawn across the gap.
+        """
+        first, last = self._cell_range(x0, x1, y0, y1)
+        starts, order = self.cell_starts[level], self.orders[level]
+        index = np.sort(np.concatenate([order[starts[f]:starts[l]] for f, l in zip(first, last)] or [order[:0]]))
+        level_x, level_y = self.levels[level]
+        x, y = level_x[index], level_y[index]
+        gaps = np.flatnonzero(np.diff(index) > 1) + 1
+        return np.insert(x, gaps, np.nan), np.insert(y, gaps, np.nan), index
+
+    def nearest(self, x, y, radius):
+        """Closest full-resolution point within `radius` of (x, y), or None."""
+        cand_x, cand_y, _ = self.query(0, x - radius, x + radius, y - radius, y + radius)
+        distances = np.hypot(cand_x - x, cand_y - y)
+        if not np.any(distances <= radius):  # NaN gap rows never compare true
+            return None
+        closest = np.nanargmin(distances)
+        return cand_x[closest], cand_y[closest]
+
+    def save(self, filename, signature):
+        arrays = {"bounds": np.array(self.bounds), "signature": np.array(signature, dtype=np.int64)}
+        for level, ((x, y), order, starts) in enumerate(zip(self.levels, self.orders, self.cell_starts)):
+            arrays[f"x{level}"], arrays[f"y{level}"] = x, y
+            arrays[f"order{level}"], arrays[f"starts{level}"] = order, starts
+        with open(filename, mode="wb") as file:  # File object keeps np.savez from renaming it
+            np.savez(file, **arrays)
+
+    @classmethod
+    def load(cls, filename, signature):
+        """Loads a saved pyramid, or returns None if it was built from a different file version."""
+        with np.load(filename) as data:
+            if tuple(data["signature"]) != tuple(signature):
+                return None
+            count = sum(1 for name in data.files if name.startswith("order"))
+            levels = [(data[f"x{k}"], data[f"y{k}"]) for k in range(count)]
+            orders = [data[f"order{k}"] for k in range(count)]
+            cell_starts = [data[f"starts{k}"] for k in range(count)]
+            return cls(levels, tuple(data["bounds"]), orders, cell_starts)
+
+
+def _cell_keys(x, y, bounds):
+    min_x, max_x, min_y, max_y = bounds
+    return _clip_cell(x, min_x, max_x) * GRID_SIZE + _clip_cell(y, min_y, max_y)
+
+
+def _clip_cell(value, low, high):
+    """Grid cell (0..GRID_SIZE-1) of value(s) along one axis."""
+    span = (high - low) or 1.0
+    return np.clip(((np.asarray(value) - low) / span * GRID_SIZE).astype(np.int64), 0, GRID_SIZE - 1)
+
+
+# -------------------------------
+# 2. On-Disk Cache Next to the CSV
+# -------------------------------
+def load_pyramid(filename):
+    """
+    Returns the PointPyramid of a points CSV (X and Y in the first two
+    columns), reusing `<filename>.pyramid.npz` when it was built from the
+    current version of the file and rebuilding it otherwise.
+    """
+    info = os.stat(filename)
+    signature = (info.st_size, info.st_mtime_ns)
+    cache_file = filename + PYRAMID_SUFFIX
+    if os.path.exists(cache_file):
+        try:
+            pyramid = PointPyramid.load(cache_file, signature)
+            if pyramid is not None:
+                return pyramid
+        except (OSError, ValueError, KeyError):
+            pass  # Unreadable cache, rebuild it
+
+    data = np.loadtxt(filename, delimiter=",", skiprows=1, usecols=(0, 1), ndmin=2)
+    pyramid = PointPyramid.build(data[:, 0], data[:, 1])
+    try:
+        pyramid.save(cache_file, signature)
+    except OSError:
+        pass  # Read-only directory: still usable, just not cached
+    return pyramid
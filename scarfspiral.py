@@ -0,0 +1,228 @@
+from functools import lru_cache
+
+import numpy as np
+
+from boundary import EllipseBoundary
+from ellipsemath import ellipse_perimeter
+from parallelgen import fill_in_parallel
+
+
+# -------------------------------
+# 1. Cached Trig Bases
+# -------------------------------
+@lru_cache(maxsize=32)
+def unit_ellipse(num_points):
+    """cos and sin of linspace(0, 2*pi, num_points), cached read-only across calls."""
+    theta = np.linspace(0, 2 * np.pi, num_points)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    cos_t.flags.writeable = sin_t.flags.writeable = False
+    return cos_t, sin_t
+
+
+@lru_cache(maxsize=32)
+def unit_ring(num_points):
+    """t = linspace(0, 1, num_points) with cos and sin of 2*pi*t, cached read-only across calls."""
+    t = np.linspace(0, 1, num_points)
+    cos_t, sin_t = np.cos(2 * np.pi * t), np.sin(2 * np.pi * t)
+    for array in (t, cos_t, sin_t):
+        array.flags.writeable = False
+    return t, cos_t, sin_t
+
+
+# -------------------------------
+# 2. Ring Counting
+# -------------------------------
+def count_rings(a, b, spacing, bbox_a=None, bbox_b=None, num_points=2000, boundary=None):
+    """
+    Counts the scarf-joint rings that fit inside the bounding shape.
+
+    Ring k blends the ellipse (a + (k-1)*spacing, b + (k-1)*spacing) into
+    (a + k*spacing, b + k*spacing); growth stops at the first outer ellipse
+    that touches the boundary, sampled at num_points like the original
+    nested-ellipse loop. The boundary is the ellipse (bbox_a, bbox_b) unless
+    another shape with a ring_escapes(x, y) test (see boundary.py) is given.
+    Ellipse boundaries are searched by bisection; other shapes ring by ring.
+    """
+    if spacing <= 0:
+        raise ValueError("spacing must be positive for an outward spiral")
+    if boundary is None:
+        boundary = EllipseBoundary(bbox_a, bbox_b)
+
+    cos_t, sin_t = unit_ellipse(num_points)
+
+    def escapes(ring):
+        return boundary.ring_escapes((a + ring * spacing) * cos_t, (b + ring * spacing) * sin_t)
+
+    if isinstance(boundary, EllipseBoundary):
+        # Inside a centred ellipse, once a ring escapes every larger one does too: bracket
+        # the first escaping ring by doubling, then bisect (O(log rings) tests, same count)
+        fits, escaping = 0, 1
+        while not escapes(escaping):
+            fits, escaping = escaping, escaping * 2
+        while escaping - fits > 1:
+            middle = (fits + escaping) // 2
+            if escapes(middle):
+                escaping = middle
+            else:
+                fits = middle
+        return fits
+
+    rings = 0
+    while not escapes(rings + 1):
+        rings += 1
+    return rings
+
+
+# -------------------------------
+# 3. Continuous Scarf-Joint Spiral
+# -------------------------------
+class ScarfSpiral:
+    """
+    Nested ellipses joined by scarf joints, evaluated as one continuous curve.
+
+    Blending ellipse k into ellipse k+1 with weight t while sweeping the angle
+    2*pi*t is the same as growing both semi-axes linearly with the turn
+    parameter u = k + t, so the whole spiral is
+
+        x(u) = (a + spacing * u) * cos(2 * pi * u)
+        y(u) = (b + spacing * u) * sin(2 * pi * u),    0 <= u <= rings
+
+    Any point or span can be evaluated at any resolution without building
+    the rings first.
+    """
+
+    def __init__(self, a, b, spacing, rings):
+        self.a = a
+        self.b = b
+        self.spacing = spacing
+        self.rings = rings
+
+    @classmethod
+    def from_bbox(cls, a, b, spacing, bbox_a=None, bbox_b=None, num_points=2000, boundary=None):
+        """Builds the spiral that grows from (a, b) until it reaches the bounding ellipse or boundary."""
+        return cls(a, b, spacing, count_rings(a, b, spacing, bbox_a, bbox_b, num_points, boundary))
+
+    def ring_axes(self, u):
+        """Semi-axes of the underlying ellipse at turn parameter u."""
+        return self.a + self.spacing * u, self.b + self.spacing * u
+
+    def __call__(self, u):
+        """Evaluates the spiral at turn parameter(s) u. Returns x, y arrays."""
+        u = np.asarray(u, dtype=float)
+        frac = u - np.floor(u)  # Angle from the fractional turn keeps precision for large u
+        current_a, current_b = self.ring_axes(u)
+        return current_a * np.cos(2 * np.pi * frac), current_b * np.sin(2 * np.pi * frac)
+
+    def span(self, u0, u1, num_points):
+        """Samples num_points evenly in u between turn parameters u0 and u1."""
+        return self(np.linspace(u0, u1, num_points))
+
+    def ring(self, index, num_points):
+        """Samples scarf ring index (0-based) at num_points, matching the original per-ring arrays."""
+        t, cos_t, sin_t = unit_ring(num_points)
+        current_a, current_b = self.ring_axes(index + t)
+        return current_a * cos_t, current_b * sin_t
+
+    def iter_rings(self, num_points):
+        """Yields (x, y) for each ring in order, so only one ring is in memory at a time."""
+        for index in range(self.rings):
+            yield self.ring(index, num_points)
+
+    def sample(self, num_points_per_ring, workers=1):
+        """
+        Samples every ring at once. Returns x, y arrays of shape (rings, num_points_per_ring).
+        With workers > 1 the rings are split across a process pool writing into shared memory.
+        """
+        out = fill_in_parallel(_fill_scarf_rings, (2, self.rings, num_points_per_ring), self.rings,
+                               args=(self.a, self.b, self.spacing, num_points_per_ring), workers=workers)
+        return out[0], out[1]
+
+
+def _fill_scarf_rings(out, start, stop, a, b, spacing, num_points):
+    """Writes rings [start, stop) of a ScarfSpiral sample into out[0] (x) and out[1] (y)."""
+    t, cos_t, sin_t = unit_ring(num_points)
+    u = np.arange(start, stop)[:, None] + t
+    out[0, start:stop] = (a + spacing * u) * cos_t
+    out[1, start:stop] = (b + spacing * u) * sin_t
+
+
+# -------------------------------
+# 4. Blended Ellipses at Uniform Arc Length
+# -------------------------------
+def blended_ellipse_points(a0, a1, b0, b1, t):
+    """
+    Points of one-turn curves whose semi-axes blend linearly from (a0, b0) to
+    (a1, b1) while the angle sweeps 2*pi*t. Plain rings have a0 == a1 and
+    b0 == b1; scarf joints and the final shrink to the origin do not.
+    Returns x, y arrays of shape (len(a0), len(t)).
+    """
+    a0, a1, b0, b1 = (np.asarray(v, dtype=float)[:, None] for v in (a0, a1, b0, b1))
+    current_a = a0 + (a1 - a0) * t
+    current_b = b0 + (b1 - b0) * t
+    return current_a * np.cos(2 * np.pi * t), current_b * np.sin(2 * np.pi * t)
+
+
+def _blended_cumulative(a0, a1, b0, b1, dense_points):
+    """Dense points of a batch of blended ellipses plus their cumulative chord lengths."""
+    t = np.linspace(0, 1, dense_points)
+    x, y = blended_ellipse_points(a0, a1, b0, b1, t)
+    cumulative = np.zeros_like(x)
+    np.cumsum(np.hypot(np.diff(x, axis=1), np.diff(y, axis=1)), axis=1, out=cumulative[:, 1:])
+    return x, y, cumulative
+
+
+def _fill_blended_lengths(out, start, stop, a0, a1, b0, b1, dense_points):
+    """Writes the lengths of curves [start, stop) into out."""
+    _, _, cumulative = _blended_cumulative(a0[start:stop], a1[start:stop], b0[start:stop], b1[start:stop],
+                                           dense_points)
+    out[start:stop] = cumulative[:, -1]
+
+
+def _fill_blended_points(out, start, stop, a0, a1, b0, b1, dense_points, counts, offsets):
+    """Writes the evenly spaced points of curves [start, stop) into out[:, offsets[start]:offsets[stop]]."""
+    x, y, cumulative = _blended_cumulative(a0[start:stop], a1[start:stop], b0[start:stop], b1[start:stop],
+                                           dense_points)
+
+    # Key each dense point by 2 * curve index + fraction of the curve's dense length,
+    # which is increasing across the whole batch (the gap of 1 keeps curves apart)
+    rows = np.arange(start, stop)
+    key = 2 * rows[:, None] + cumulative / np.maximum(cumulative[:, -1:], np.finfo(float).tiny)
+
+    # Ragged targets: 0, 1/(n-1), ..., 1 along each curve
+    curve_counts = counts[start:stop]
+    position = np.arange(curve_counts.sum()) - np.repeat(offsets[start:stop] - offsets[start], curve_counts)
+    target = 2 * np.repeat(rows, curve_counts) + position / np.repeat(curve_counts - 1, curve_counts)
+
+    out[0, offsets[start]:offsets[stop]] = np.interp(target, key.ravel(), x.ravel())
+    out[1, offsets[start]:offsets[stop]] = np.interp(target, key.ravel(), y.ravel())
+
+
+def sample_blended_ellipses(a0, a1, b0, b1, point_spacing, dense_points=4096, workers=1):
+    """
+    Samples a batch of blended ellipses with points evenly spaced by arc length.
+
+    Each curve gets about length / point_spacing points regardless of its
+    size. Plain rings (a0 == a1 and b0 == b1) take their length from the
+    exact AGM perimeter in ellipsemath; only blended curves (scarf joints and
+    the shrink to the origin) need a dense chord-length pass for it. Every
+    curve is then densely sampled, its cumulative chord length inverted and
+    the targets interpolated in one np.interp call over all curves. With
+    workers > 1 the curves are split across a process pool writing into
+    shared memory. Returns flat x, y arrays plus the number of points per curve.
+    """
+    a0, a1, b0, b1 = (np.atleast_1d(np.asarray(v, dtype=float)) for v in (a0, a1, b0, b1))
+    curves = len(a0)
+
+    plain = (a0 == a1) & (b0 == b1)
+    lengths = np.empty(curves)
+    lengths[plain] = ellipse_perimeter(a0[plain], b0[plain])
+    blended = np.flatnonzero(~plain)
+    lengths[blended] = fill_in_parallel(_fill_blended_lengths, (len(blended),), len(blended),
+                                        args=(a0[blended], a1[blended], b0[blended], b1[blended], dense_points),
+                                        workers=workers)
+    counts = np.maximum(2, np.rint(lengths / point_spacing).astype(int) + 1)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    out = fill_in_parallel(_fill_blended_points, (2, offsets[-1]), curves,
+                           args=(a0, a1, b0, b1, dense_points, counts, offsets), workers=workers)
+    return out[0], out[1], counts
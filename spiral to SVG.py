@@ -2,6 +2,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import csv
 
+from outputwriters import OutputWriterPool
+from spiralplot import plot_rings_as_collection
+
 # Function to generate evenly spaced points along an ellipse
 def generate_ellipse_points(a, b, num_points):
     t = np.linspace(0, 2 * np.pi, num_points)  # Parameter t
@@ -29,7 +32,7 @@ def write_points_to_csv(points, csv_point_reduction_factor, spacing, y_offset_pe
     print(f"\n✅ Total points saved to CSV: {total_saved_points}")
 
 # Function to generate nested ellipses with scarf joints
-def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage):
+def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage, single_artist=False):
     num_points_per_ellipse = 2000  # Increased resolution of ellipses
     current_a, current_b = a, b
     prev_x, prev_y = generate_ellipse_points(current_a, current_b, num_points_per_ellipse)
@@ -60,14 +63,17 @@ def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_
             t = np.linspace(0, 1, len(last_x))
             x_scarf = (1 - t) * last_x + t * prev_x
             y_scarf = (1 - t) * last_y + t * prev_y
-            ax.plot(x_scarf, y_scarf + y_offset, 'k')  # Apply Y-axis offset
+            final_joint = (x_scarf, y_scarf)
+            if not single_artist:
+                ax.plot(x_scarf, y_scarf + y_offset, 'k')  # Apply Y-axis offset
             break  # Stop once intersection occurs
         
         # Plot the current ellipse with scarf joint as black line
         t = np.linspace(0, 1, len(x))
         x_scarf = (1 - t) * prev_x + t * x  # Interpolate x
         y_scarf = (1 - t) * prev_y + t * y  # Interpolate y
-        ax.plot(x_scarf, y_scarf + y_offset, 'k')  # Apply Y-axis offset
+        if not single_artist:
+            ax.plot(x_scarf, y_scarf + y_offset, 'k')  # Apply Y-axis offset
         
         # Store generated ellipses for CSV
         generated_ellipses.append((x_scarf, y_scarf))
@@ -82,6 +88,10 @@ def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_
         last_x, last_y = prev_x, prev_y
         prev_x, prev_y = x, y
 
+    # All rings and the final joint as one black artist, so SVG export stays fast for any ring count
+    if single_artist:
+        plot_rings_as_collection(ax, generated_ellipses + [final_joint], y_offset, color='k')
+
     # Add 10mm to each end for the plot bounds
     ax.set_xlim(min_x - 10, max_x + 10)
     ax.set_ylim(min_y - 10, max_y + 10)
@@ -97,30 +107,35 @@ def main():
     bbox_b = b * 21  # Bounding ellipse semi-minor axis (in mm)
     csv_point_reduction_factor = 10  # Adjust how many points are saved in CSV
     y_offset_percentage = 25  # Percentage to move the diagram up (e.g., 30%)
+    single_artist = True  # Draw all rings as one line collection (one SVG path element per ring, one artist)
 
     # Generate the ellipses and calculate the final bounding box size
     fig, ax = plt.subplots(figsize=(8, 8))  # Use a standard size for the figure
     ax.set_aspect('equal', 'box')
 
     # Generate ellipses
-    generated_ellipses = draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage)
-
-    # Write points to CSV (excluding bounding ellipse)
-    write_points_to_csv(generated_ellipses, csv_point_reduction_factor, spacing, y_offset_percentage)
-    
-    # Remove title and axes labels
-    ax.set_title('')  # Remove title
-    ax.set_xlabel('')  # Remove x-axis label
-    ax.set_ylabel('')  # Remove y-axis label
-    ax.grid(False)  # Disable grid
-    ax.legend([])  # Remove legend
-    ax.set_axis_off()  # Remove the axis
-
-    # Show plot
-    plt.show()
-
-    # Save the plot as an SVG file after removing unwanted elements
-    fig.savefig("nested_ellipses_spiral.svg", format='svg', bbox_inches='tight')
+    generated_ellipses = draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage,
+                                                         single_artist)
+
+    with OutputWriterPool() as writers:
+        # Write points to CSV (excluding bounding ellipse) in the background
+        writers.submit(write_points_to_csv, generated_ellipses, csv_point_reduction_factor, spacing,
+                       y_offset_percentage)
+
+        # Remove title and axes labels
+        ax.set_title('')  # Remove title
+        ax.set_xlabel('')  # Remove x-axis label
+        ax.set_ylabel('')  # Remove y-axis label
+        ax.grid(False)  # Disable grid
+        ax.legend([])  # Remove legend
+        ax.set_axis_off()  # Remove the axis
+
+        # Show plot
+        plt.show()
+
+        # Save the plot as an SVG file after removing unwanted elements. Matplotlib renders on the
+        # main thread only; the CSV write queued above overlaps it
+        fig.savefig("nested_ellipses_spiral.svg", format='svg', bbox_inches='tight')
 
 # Run the script
 main()
@@ -1,6 +1,15 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import csv
+import importlib
+
+from arcpath import ArcLengthPath
+from boundary import EllipseBoundary
+from clearance import check_rings_clearance, print_clearance_report
+from outputwriters import OutputWriterPool
+from scarfspiral import ScarfSpiral
+from spiralplot import plot_rings_as_collection
+from surfaceresample import CylinderSurface, iter_resample_on_surface
 
 # Function to generate evenly spaced points along an ellipse
 def generate_ellipse_points(a, b, num_points):
@@ -28,58 +37,138 @@ def write_points_to_csv(points, csv_point_reduction_factor, spacing, y_offset_pe
 
     print(f"\n✅ Total points saved to CSV: {total_saved_points}")
 
+# Function to write an already resampled path to a CSV file
+def write_path_to_csv(x, y, filename="ellipse_points.csv"):
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.writer(file, delimiter=',')
+        writer.writerow(["X", "Y"])  # Write headers
+        writer.writerows(zip(x.tolist(), y.tolist()))
+
+    print(f"\n✅ Total points saved to CSV: {len(x)}")
+
+# Function to join all rings into one path and resample it every point_spacing along its length
+def resample_rings(rings, point_spacing, y_offset):
+    x, y = ArcLengthPath.from_rings(rings).resample(point_spacing)
+    return x, y + y_offset  # Apply dynamic Y-axis offset
+
 # Function to generate nested ellipses with scarf joints
-def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage):
+def draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage, workers=1, boundary=None,
+                                    single_artist=False):
     num_points_per_ellipse = 2000  # Increased resolution of ellipses
-    current_a, current_b = a, b
-    prev_x, prev_y = generate_ellipse_points(current_a, current_b, num_points_per_ellipse)
+    initial_x, initial_y = generate_ellipse_points(a, b, num_points_per_ellipse)
 
     # Calculate the Y offset based on the percentage
     y_offset = y_offset_percentage * spacing / 100
 
-    ax.plot(prev_x, prev_y + y_offset, 'k--', label="Initial Ellipse")  # Dotted line for first ellipse
+    ax.plot(initial_x, initial_y + y_offset, 'k--', label="Initial Ellipse")  # Dotted line for first ellipse
     
-    last_x, last_y = prev_x, prev_y
     generated_ellipses = []  # Store ellipses for CSV
 
-    # Plot the bounding ellipse (dotted red line)
-    bbox_x, bbox_y = generate_ellipse_points(bbox_a, bbox_b, num_points_per_ellipse)
-    ax.plot(bbox_x, bbox_y + y_offset, 'r--', label="Bounding Ellipse")  # Bounding ellipse in dotted red line
+    # Plot the bounding shape (dotted red line); the bounding ellipse unless another boundary is given
+    if boundary is None:
+        boundary = EllipseBoundary(bbox_a, bbox_b)
+    bbox_x, bbox_y = boundary.outline(num_points_per_ellipse)
+    ax.plot(bbox_x, bbox_y + y_offset, 'r--', label="Bounding Shape")  # Bounding shape in dotted red line
     
-    # Generate nested ellipses until bounding ellipse is intersected
-    while True:
-        current_a += spacing
-        current_b += spacing
-        
-        # Generate the new ellipse
-        x, y = generate_ellipse_points(current_a, current_b, num_points_per_ellipse)
-        
-        # Check if any part of the ellipse intersects the bounding ellipse
-        intersects = any((px**2 / bbox_a**2 + py**2 / bbox_b**2) >= 1 for px, py in zip(x, y))
-        
-        if intersects:
-            # Final scarf joint
-            t = np.linspace(0, 1, len(last_x))
-            x_scarf = (1 - t) * last_x + t * prev_x
-            y_scarf = (1 - t) * last_y + t * prev_y
-            ax.plot(x_scarf, y_scarf + y_offset, 'b', label="Final Scarf Joint")  # Apply Y-axis offset
-            break  # Stop once intersection occurs
-        
-        # Plot the current ellipse with scarf joint
-        t = np.linspace(0, 1, len(x))
-        x_scarf = (1 - t) * prev_x + t * x  # Interpolate x
-        y_scarf = (1 - t) * prev_y + t * y  # Interpolate y
-        ax.plot(x_scarf, y_scarf + y_offset, label=f'a={current_a:.1f}, b={current_b:.1f}')  # Apply Y-axis offset
+    # Grow the spiral until the next ellipse would cross the bounding shape
+    spiral = ScarfSpiral.from_bbox(a, b, spacing, num_points=num_points_per_ellipse, boundary=boundary)
+    rings_x, rings_y = spiral.sample(num_points_per_ellipse, workers=workers)  # Every ring with its scarf joint
+
+    for ring in range(spiral.rings):
+        x_scarf, y_scarf = rings_x[ring], rings_y[ring]
+        if not single_artist:
+            current_a, current_b = spiral.ring_axes(ring + 1)
+            ax.plot(x_scarf, y_scarf + y_offset, label=f'a={current_a:.1f}, b={current_b:.1f}')  # Apply Y-axis offset
         
         # Store generated ellipses for CSV
         generated_ellipses.append((x_scarf, y_scarf))
-        
-        # Update previous ellipse
-        last_x, last_y = prev_x, prev_y
-        prev_x, prev_y = x, y
+
+    # All rings as one colormapped artist, with a ring-index colorbar instead of legend entries
+    if single_artist:
+        plot_rings_as_collection(ax, generated_ellipses, y_offset)
+
+    # Final scarf joint (retraces the last ring)
+    last_x, last_y = generated_ellipses[-1] if generated_ellipses else (initial_x, initial_y)
+    ax.plot(last_x, last_y + y_offset, 'b', label="Final Scarf Joint")  # Apply Y-axis offset
     
     return generated_ellipses
 
+# Function to yield the saved CSV points ring by ring (every nth point, Y offset applied)
+def iter_csv_points(rings, csv_point_reduction_factor, y_offset):
+    for x_data, y_data in rings:
+        yield x_data[::csv_point_reduction_factor], y_data[::csv_point_reduction_factor] + y_offset
+
+# Function to yield equally spaced points ring by ring, carrying the spacing across ring joints
+def iter_resampled_points(rings, point_spacing, y_offset):
+    next_s = 0.0  # Arc length into the current ring of its first saved point
+    last = None
+    for x_data, y_data in rings:
+        path = ArcLengthPath(x_data, y_data)
+        x, y = path.resample(point_spacing, start=next_s, include_end=False)
+        if len(x):
+            next_s += len(x) * point_spacing
+        next_s -= path.length
+        last = x_data[-1], y_data[-1]
+        yield x, y + y_offset
+    if last is not None and next_s < point_spacing:  # Keep the end of the path unless it was just saved
+        yield np.array([last[0]]), np.array([last[1] + y_offset])
+
+# Function to stream the spiral straight to ellipse_points.csv and sticker_coordinates.csv
+def stream_spiral_to_disk(a, b, spacing, bbox_a, bbox_b, csv_point_reduction_factor, y_offset_percentage,
+                          points_filename="ellipse_points.csv", sticker_filename="sticker_coordinates.csv",
+                          boundary=None, point_spacing=None):
+    """
+    Generates, writes and wraps the spiral one ring at a time, so memory stays
+    constant however many rings there are. No preview is drawn.
+    """
+    wrap = importlib.import_module("3dmodelwrappy")  # Module name starts with a digit
+    num_points_per_ellipse = 2000
+    y_offset = y_offset_percentage * spacing / 100
+    spiral = ScarfSpiral.from_bbox(a, b, spacing, bbox_a, bbox_b, num_points_per_ellipse, boundary)
+
+    def csv_points():
+        rings = spiral.iter_rings(num_points_per_ellipse)
+        if point_spacing:
+            return iter_resampled_points(rings, point_spacing, y_offset)
+        return iter_csv_points(rings, csv_point_reduction_factor, y_offset)
+
+    # First pass: X range of the rotated points, which centres the cylinder wrap
+    min_x, max_x = np.inf, -np.inf
+    for x, y in csv_points():
+        rotated_x, _ = wrap.rotate_points(x, y, wrap.ROTATION_ANGLE_DEGREES)
+        min_x, max_x = min(min_x, rotated_x.min()), max(max_x, rotated_x.max())
+    center_x = (min_x + max_x) / 2.0
+
+    # Second pass: write flat and wrapped points ring by ring
+    total_saved_points = 0
+    with open(points_filename, mode="w", newline="") as points_file, \
+            open(sticker_filename, mode="w", newline="") as sticker_file:
+        points_writer = csv.writer(points_file, delimiter=',')
+        sticker_writer = csv.writer(sticker_file)
+        points_writer.writerow(["X", "Y"])
+        sticker_writer.writerow(["X", "Y", "Z"])
+
+        def wrapped_points():
+            nonlocal total_saved_points
+            for x, y in csv_points():
+                points_writer.writerows(zip(x.tolist(), y.tolist()))
+                total_saved_points += len(x)
+                rotated_x, rotated_y = wrap.rotate_points(x, y, wrap.ROTATION_ANGLE_DEGREES)
+                yield wrap.map_points_to_cylinder(rotated_x, rotated_y, cylinder_radius=wrap.CYLINDER_RADIUS,
+                                                  center_x=center_x)
+
+        # Equal geodesic steps on the cylinder, as 3dmodelwrappy.py does with SURFACE_POINT_SPACING
+        sticker_points = wrapped_points()
+        if wrap.SURFACE_POINT_SPACING:
+            surface = CylinderSurface(wrap.CYLINDER_RADIUS, center_x)
+            sticker_points = iter_resample_on_surface(surface, sticker_points, wrap.SURFACE_POINT_SPACING)
+
+        for mapped_x, mapped_y, mapped_z in sticker_points:
+            sticker_writer.writerows(zip(mapped_x.tolist(), mapped_y.tolist(), mapped_z.tolist()))
+
+    print(f"\n✅ Total points saved to CSV: {total_saved_points}")
+    print(f"Sticker coordinates exported to {sticker_filename}")
+
 # Main function
 def main():
     a = 60  # Initial semi-major axis a gotta be bigger than b 
@@ -87,28 +176,54 @@ def main():
     spacing = 10  # Spacing between ellipses
     bbox_a = a * 21  # Bounding ellipse semi-major axis
     bbox_b = b * 21  # Bounding ellipse semi-minor axis
+    # Optional label shape instead of the bounding ellipse (boundary.PolygonBoundary), e.g. from the dieline's SVG path:
+    # boundary = PolygonBoundary.from_svg_path("M 0 0 H 2400 V 80 H 0 Z")
+    # boundary = PolygonBoundary.rounded_rectangle(2400, 80, 20)
+    boundary = None
     csv_point_reduction_factor = 50  # Adjust how many points are saved in CSV
+    point_spacing = 2.5  # Distance between saved points along the path (None = every nth point instead)
     y_offset_percentage = 25  # Percentage to move the diagram up (e.g., 30%)
+    stream_to_disk = False  # Stream rings straight to the CSVs with constant memory (no preview)
+    workers = 1  # Processes used to generate the rings (1 = serial, None = all cores)
+    min_clearance = spacing / 2  # Smallest manufacturable gap between neighbouring rings
+    single_artist = True  # Draw all rings as one line collection with a ring colorbar (False = one line per ring)
+
+    if stream_to_disk:
+        stream_spiral_to_disk(a, b, spacing, bbox_a, bbox_b, csv_point_reduction_factor, y_offset_percentage,
+                              boundary=boundary, point_spacing=point_spacing)
+        return
 
     # Set up the plot with full-screen size
     fig, ax = plt.subplots(figsize=(22, 22))  # Maximize figure size
-    ax.set_xlim(-bbox_a * 1.1, bbox_a * 1.1)  # Scale dynamically based on bounding ellipse
-    ax.set_ylim(-bbox_b * 1.1, bbox_b * 1.1)
+    min_x, max_x, min_y, max_y = (boundary or EllipseBoundary(bbox_a, bbox_b)).bounds
+    ax.set_xlim(min_x * 1.1, max_x * 1.1)  # Scale dynamically based on bounding shape
+    ax.set_ylim(min_y * 1.1, max_y * 1.1)
     ax.set_aspect('equal', 'box')
 
     # Generate ellipses
-    generated_ellipses = draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage)
+    generated_ellipses = draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax, y_offset_percentage,
+                                                         workers, boundary, single_artist)
 
-    # Write points to CSV (excluding bounding ellipse)
-    write_points_to_csv(generated_ellipses, csv_point_reduction_factor, spacing, y_offset_percentage)
-    
-    # Show plot
-    ax.set_title('Ellipses Expanding to Bounding Ellipse with Scarf Joints')
-    plt.xlabel('X')
-    plt.ylabel('Y')
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    with OutputWriterPool() as writers:
+        # Write points to CSV (excluding bounding ellipse) in the background
+        if point_spacing and generated_ellipses:
+            y_offset = y_offset_percentage * spacing / 100
+            writers.submit(write_path_to_csv, *resample_rings(generated_ellipses, point_spacing, y_offset))
+        else:
+            writers.submit(write_points_to_csv, generated_ellipses, csv_point_reduction_factor, spacing,
+                           y_offset_percentage)
+
+        # Check the real gap between neighbouring rings before anything is cut
+        print_clearance_report(check_rings_clearance(generated_ellipses, min_clearance), min_clearance)
+
+        # Show plot
+        ax.set_title('Ellipses Expanding to Bounding Ellipse with Scarf Joints')
+        plt.xlabel('X')
+        plt.ylabel('Y')
+        plt.grid(True)
+        plt.legend()
+        plt.show()
 
 # Run the script
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import Normalize
+from matplotlib.ticker import MaxNLocator
+
+
+# -------------------------------
+# Single-Artist Ring Plotting
+# -------------------------------
+def plot_rings_as_collection(ax, rings, y_offset=0.0, cmap="viridis", colorbar=True, color=None, linewidth=1.0):
+    """
+    Draws every ring ((x, y) arrays, any lengths) as one LineCollection.
+
+    One artist instead of one Line2D per ring keeps drawing, legend and
+    savefig time flat as the ring count grows. Rings are coloured by index
+    from `cmap` and, with colorbar=True, a colorbar labelled with ring index
+    replaces the per-ring legend entries. Pass `color` for a single colour
+    (e.g. 'k' for cutting SVGs) instead of the colormap.
+    """
+    segments = [np.column_stack((x, np.asarray(y) + y_offset)) for x, y in rings]
+    if color is not None:
+        collection = LineCollection(segments, colors=color, linewidths=linewidth)
+    else:
+        collection = LineCollection(segments, cmap=cmap, norm=Normalize(0, max(len(segments) - 1, 1)),
+                                    linewidths=linewidth)
+        collection.set_array(np.arange(len(segments)))
+    ax.add_collection(collection)
+    ax.autoscale_view()
+
+    if colorbar and color is None and segments:
+        bar = ax.figure.colorbar(collection, ax=ax, shrink=0.6)
+        bar.set_label("Ring")
+        bar.locator = MaxNLocator(integer=True)
+        bar.update_ticks()
+    return collection
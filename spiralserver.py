@@ -0,0 +1,232 @@
+import argparse
+import csv
+import importlib
+import json
+import os
+import socketserver
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from arcpath import ArcLengthPath
+from scarfspiral import ScarfSpiral
+from surfaceresample import CylinderSurface, resample_on_surface
+
+wrap = importlib.import_module("3dmodelwrappy")  # Module name starts with a digit
+
+# Defaults match the pipeline: main() in spiraleclipSPACINGEQUALPOINT.py and the
+# module settings in 3dmodelwrappy.py. The spacings may be null: no point_spacing
+# keeps every csv_point_reduction_factor-th point, no surface_point_spacing keeps
+# the flat spacing on the cylinder.
+DEFAULT_PARAMS = {
+    "a": 60,
+    "b": 2,
+    "spacing": 10,
+    "bbox_multiplier": 21,
+    "rotation": wrap.ROTATION_ANGLE_DEGREES,
+    "cylinder_radius": wrap.CYLINDER_RADIUS,
+    "csv_point_reduction_factor": 50,
+    "y_offset_percentage": 25,
+    "num_points_per_ellipse": 2000,
+    "point_spacing": 2.5,
+    "surface_point_spacing": wrap.SURFACE_POINT_SPACING,
+}
+OPTIONAL_PARAMS = {"point_spacing", "surface_point_spacing"}
+
+
+# -------------------------------
+# 1. Generation (warm caches)
+# -------------------------------
+@lru_cache(maxsize=64)
+def flat_points(a, b, spacing, bbox_multiplier, csv_point_reduction_factor, y_offset_percentage,
+                num_points_per_ellipse, point_spacing=None):
+    """
+    The flat CSV points of a spiral and their path length, cached by spiral
+    parameters so requests that only change the wrap settings skip generation.
+    Ring sampling itself reuses the cached trig bases in scarfspiral. With a
+    point_spacing the rings are joined and resampled along their length, as
+    in spiraleclipSPACINGEQUALPOINT.py; otherwise every
+    csv_point_reduction_factor-th point is kept.
+    """
+    spiral = ScarfSpiral.from_bbox(a, b, spacing, a * bbox_multiplier, b * bbox_multiplier, num_points_per_ellipse)
+    x, y = spiral.sample(num_points_per_ellipse)
+    y_offset = y_offset_percentage * spacing / 100
+    if point_spacing and spiral.rings:
+        x, y = ArcLengthPath.from_rings(list(zip(x, y))).resample(point_spacing)
+        y = y + y_offset
+    else:
+        x = x[:, ::csv_point_reduction_factor].ravel()
+        y = y[:, ::csv_point_reduction_factor].ravel() + y_offset
+    for array in (x, y):
+        array.flags.writeable = False
+    path_length = ArcLengthPath(x, y).length if len(x) > 1 else 0.0
+    return spiral.rings, x, y, path_length
+
+
+def parse_params(request):
+    """Merges a JSON request over DEFAULT_PARAMS, rejecting unknown or mistyped values."""
+    unknown = set(request) - set(DEFAULT_PARAMS) - {"output_dir", "include_points"}
+    if unknown:
+        raise ValueError(f"unknown parameter(s): {', '.join(sorted(unknown))}")
+    if "output_dir" in request and not isinstance(request["output_dir"], str):
+        raise ValueError("output_dir must be a string")
+    if "include_points" in request and not isinstance(request["include_points"], bool):
+        raise ValueError("include_points must be true or false")
+    params = dict(DEFAULT_PARAMS)
+    for name in DEFAULT_PARAMS:
+        if name in request:
+            value = request[name]
+            if value is None and name in OPTIONAL_PARAMS:
+                params[name] = None
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{name} must be a number" + (" or null" if name in OPTIONAL_PARAMS else ""))
+            params[name] = value
+    for name in ("csv_point_reduction_factor", "num_points_per_ellipse"):
+        params[name] = int(params[name])
+    if params["spacing"] <= 0 or params["a"] <= 0 or params["b"] <= 0 or params["cylinder_radius"] <= 0:
+        raise ValueError("a, b, spacing and cylinder_radius must be positive")
+    if params["csv_point_reduction_factor"] < 1 or params["num_points_per_ellipse"] < 2:
+        raise ValueError("csv_point_reduction_factor must be >= 1 and num_points_per_ellipse >= 2")
+    if any(params[name] is not None and params[name] <= 0 for name in OPTIONAL_PARAMS):
+        raise ValueError("point_spacing and surface_point_spacing must be positive or null")
+    return params
+
+
+def write_outputs(output_dir, x, y, mapped_x, mapped_y, mapped_z):
+    """Writes ellipse_points.csv and sticker_coordinates.csv into output_dir."""
+    os.makedirs(output_dir, exist_ok=True)
+    points_file = os.path.join(output_dir, "ellipse_points.csv")
+    sticker_file = os.path.join(output_dir, "sticker_coordinates.csv")
+    with open(points_file, mode="w", newline="") as file:
+        writer = csv.writer(file, delimiter=',')
+        writer.writerow(["X", "Y"])
+        writer.writerows(zip(x.tolist(), y.tolist()))
+    with open(sticker_file, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["X", "Y", "Z"])
+        writer.writerows(zip(mapped_x.tolist(), mapped_y.tolist(), mapped_z.tolist()))
+    return {"ellipse_points": points_file, "sticker_coordinates": sticker_file}
+
+
+def handle_request(request):
+    """
+    Runs one generation request (a dict, as decoded from JSON) and returns the
+    JSON-serialisable response. Needs no sockets, so it is testable offline.
+    """
+    start = time.perf_counter()
+    params = parse_params(request)
+    rings, x, y, path_length = flat_points(
+        params["a"], params["b"], params["spacing"], params["bbox_multiplier"],
+        params["csv_point_reduction_factor"], params["y_offset_percentage"], params["num_points_per_ellipse"],
+        params["point_spacing"])
+
+    rotated_x, rotated_y = wrap.rotate_points(x, y, params["rotation"])
+    if len(x):
+        center_x = (np.min(rotated_x) + np.max(rotated_x)) / 2.0
+        mapped_x, mapped_y, mapped_z = wrap.map_points_to_cylinder(rotated_x, rotated_y, params["cylinder_radius"],
+                                                                   center_x)
+        # Same optional geodesic resampling as 3dmodelwrappy.py
+        if params["surface_point_spacing"] and len(x) > 1:
+            surface = CylinderSurface(params["cylinder_radius"], center_x)
+            mapped_x, mapped_y, mapped_z = resample_on_surface(surface, mapped_x, mapped_y, mapped_z,
+                                                               params["surface_point_spacing"])
+    else:
+        mapped_x = mapped_y = mapped_z = np.empty(0)
+
+    response = {"params": params, "rings": rings, "points": len(x), "path_length": path_length}
+    if "output_dir" in request:
+        response["files"] = write_outputs(request["output_dir"], x, y, mapped_x, mapped_y, mapped_z)
+    if request.get("include_points", "output_dir" not in request):
+        response["flat"] = np.column_stack((x, y)).tolist()
+        response["sticker"] = np.column_stack((mapped_x, mapped_y, mapped_z)).tolist()
+    response["elapsed_ms"] = (time.perf_counter() - start) * 1000
+    return response
+
+
+# -------------------------------
+# 2. HTTP / Unix-Socket Service
+# -------------------------------
+class SpiralRequestHandler(BaseHTTPRequestHandler):
+    """POST /generate with a JSON parameter set; GET /health for a liveness check."""
+
+    pool = None  # ThreadPoolExecutor shared by all connections, set by make_server
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "cached_spirals": flat_points.cache_info().currsize})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/generate":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("request body must be a JSON object")
+            response = self.pool.submit(handle_request, request).result()
+        except (ValueError, json.JSONDecodeError) as error:
+            self._send_json(400, {"error": str(error)})
+            return
+        except Exception as error:
+            self._send_json(500, {"error": repr(error)})
+            return
+        self._send_json(200, response)
+
+    def address_string(self):
+        # Unix-socket clients have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def make_server(port=8765, socket_path=None, workers=4):
+    """Builds the server; generation requests run on a pool of `workers` threads."""
+    SpiralRequestHandler.pool = ThreadPoolExecutor(max_workers=workers)
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        return ThreadingUnixHTTPServer(socket_path, SpiralRequestHandler)
+    return ThreadingHTTPServer(("127.0.0.1", port), SpiralRequestHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local spiral generation service with warm caches.")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port on 127.0.0.1")
+    parser.add_argument("--socket", help="Serve on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent generation requests")
+    args = parser.parse_args()
+
+    server = make_server(args.port, args.socket, args.workers)
+    where = args.socket or f"http://127.0.0.1:{args.port}"
+    print(f"Serving spiral generation on {where} (POST /generate, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        SpiralRequestHandler.pool.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import importlib
+import time
+from functools import lru_cache
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.widgets import Slider
+
+from scarfspiral import ScarfSpiral
+
+wrap = importlib.import_module("3dmodelwrappy")  # Module name starts with a digit
+
+BBOX_MULTIPLIER = 21  # Bounding ellipse size relative to (a, b), as in spiraleclipSPACINGEQUALPOINT.py
+FRAME_BUDGET = 1 / 30  # Seconds an update may take before the preview resolution is reduced
+MIN_PREVIEW_POINTS = 1000
+MAX_PREVIEW_POINTS = 20000  # More points than this cost more to draw than they add to the preview
+MAX_3D_POINTS = 4000  # 3D lines are far slower to draw, so the cylinder view shows every nth point
+
+# Pipeline stages in order, with the parameters each one reads. Moving a
+# slider recomputes its stage and the stages after it; earlier results are reused.
+STAGES = [
+    ("generate", ("a", "b", "spacing")),
+    ("offset", ("y_offset_percentage",)),
+    ("rotate", ("rotation_angle_degrees",)),
+    ("map", ("cylinder_radius",)),
+]
+
+# Slider name -> (label, min, max)
+SLIDERS = {
+    "a": ("a", 5, 300),
+    "b": ("b", 1, 100),
+    "spacing": ("spacing", 1, 50),
+    "y_offset_percentage": ("y offset %", 0, 100),
+    "rotation_angle_degrees": ("rotation", -180, 180),
+    "cylinder_radius": ("cylinder radius", 50, 5000),
+}
+
+
+# -------------------------------
+# 1. Staged Computation
+# -------------------------------
+@lru_cache(maxsize=16)
+def preview_spiral(a, b, spacing, preview_points, num_points_per_ellipse=2000):
+    """
+    Flat spiral points with about preview_points in total, cached so returning
+    to earlier slider values is instant. The bounding ellipse lets ring
+    counting bisect (a few escape tests however many rings fit), and sampling
+    reuses the cached trig bases in scarfspiral.
+    """
+    spiral = ScarfSpiral.from_bbox(a, b, spacing, a * BBOX_MULTIPLIER, b * BBOX_MULTIPLIER, num_points_per_ellipse)
+    points_per_ring = int(np.clip(preview_points // max(spiral.rings, 1), 16, num_points_per_ellipse))
+    x, y = spiral.sample(points_per_ring)
+    x, y = x.ravel(), y.ravel()
+    x.flags.writeable = y.flags.writeable = False
+    return spiral.rings, x, y
+
+
+class TunerPipeline:
+    """
+    Generate -> offset -> rotate -> map, with each stage's result cached.
+
+    set(name, value) invalidates only the stage that reads the parameter and
+    the stages after it. The number of preview points adapts so that an update
+    stays within FRAME_BUDGET.
+    """
+
+    def __init__(self, params, preview_points=20000, num_points_per_ellipse=2000):
+        self.params = dict(params)
+        self.preview_points = preview_points
+        self.num_points_per_ellipse = num_points_per_ellipse
+        self.results = {}  # Stage name -> output of that stage
+        self.last_elapsed = 0.0
+
+    def set(self, name, value):
+        """Updates one parameter and returns the name of the first stage that must be recomputed."""
+        self.params[name] = value
+        first = next(index for index, (_, names) in enumerate(STAGES) if name in names)
+        for stage, _ in STAGES[first:]:
+            self.results.pop(stage, None)
+        return STAGES[first][0]
+
+    def compute(self):
+        """Runs the stages whose results are missing and returns the final results dict."""
+        start = time.perf_counter()
+        p = self.params
+        regenerated = "generate" not in self.results
+        if regenerated:
+            self.results["generate"] = preview_spiral(p["a"], p["b"], p["spacing"], self.preview_points,
+                                                      self.num_points_per_ellipse)
+        if "offset" not in self.results:
+            _, x, y = self.results["generate"]
+            self.results["offset"] = (x, y + p["y_offset_percentage"] * p["spacing"] / 100)
+        if "rotate" not in self.results:
+            self.results["rotate"] = wrap.rotate_points(*self.results["offset"], p["rotation_angle_degrees"])
+        if "map" not in self.results:
+            rotated_x, rotated_y = self.results["rotate"]
+            self.results["map"] = (wrap.map_points_to_cylinder(rotated_x, rotated_y, p["cylinder_radius"])
+                                   if len(rotated_x) else (rotated_x, rotated_y, rotated_x))
+
+        # Keep later updates inside the frame budget by adapting the preview resolution,
+        # judged on full recomputes since the later stages alone are always cheap
+        self.last_elapsed = time.perf_counter() - start
+        if regenerated and self.last_elapsed > FRAME_BUDGET and self.preview_points > MIN_PREVIEW_POINTS:
+            self.preview_points //= 2
+        elif regenerated and self.last_elapsed < FRAME_BUDGET / 4 and self.preview_points < MAX_PREVIEW_POINTS:
+            self.preview_points = min(self.preview_points * 2, MAX_PREVIEW_POINTS)
+        return self.results
+
+
+# -------------------------------
+# 2. Tuner Window
+# -------------------------------
+def decimate_3d(points):
+    """Every nth point of the mapped coordinates, keeping at most MAX_3D_POINTS."""
+    step = max(1, -(-len(points[0]) // MAX_3D_POINTS))
+    return tuple(values[::step] for values in points)
+
+
+def run_tuner(params):
+    pipeline = TunerPipeline(params)
+    results = pipeline.compute()
+
+    fig = plt.figure(figsize=(14, 8))
+    ax_flat = fig.add_axes([0.05, 0.42, 0.42, 0.52])
+    ax_mapped = fig.add_axes([0.53, 0.42, 0.42, 0.52], projection='3d')
+
+    # Artists are created once and updated in place
+    flat_line, = ax_flat.plot(*results["offset"], color='k', linewidth=0.7, label="Flat")
+    rotated_line, = ax_flat.plot(*results["rotate"], color='b', linewidth=0.7, label="Rotated")
+    mapped_line, = ax_mapped.plot(*decimate_3d(results["map"]), color='g', linewidth=0.7)
+    ax_flat.set_aspect('equal', 'datalim')
+    ax_flat.legend(loc="upper right")
+    ax_mapped.set_xlabel("X (Cylinder)")
+    ax_mapped.set_ylabel("Y (Height)")
+    ax_mapped.set_zlabel("Z (Cylinder)")
+    status = fig.text(0.05, 0.96, "")
+
+    def rescale():
+        ax_flat.relim()
+        ax_flat.autoscale_view()
+        mapped_x, mapped_y, mapped_z = results["map"]
+        if len(mapped_x):
+            ax_mapped.set_xlim(mapped_x.min(), mapped_x.max())
+            ax_mapped.set_ylim(mapped_y.min(), mapped_y.max())
+            ax_mapped.set_zlim(mapped_z.min(), mapped_z.max())
+            wrap.set_axes_equal(ax_mapped)
+
+    # Function to recompute the affected stages and update the artists when a slider moves
+    def on_change(name, value):
+        first_stage = pipeline.set(name, value)
+        pipeline.compute()
+        flat_line.set_data(*results["offset"])
+        rotated_line.set_data(*results["rotate"])
+        mapped_line.set_data_3d(*decimate_3d(results["map"]))
+        rescale()
+        rings = results["generate"][0]
+        status.set_text(f"{rings} rings, {len(results['offset'][0])} preview points, "
+                        f"recomputed from '{first_stage}' in {pipeline.last_elapsed * 1000:.1f} ms")
+        fig.canvas.draw_idle()
+
+    rescale()
+    sliders = []
+    for row, (name, (label, low, high)) in enumerate(SLIDERS.items()):
+        slider_ax = fig.add_axes([0.15, 0.32 - row * 0.05, 0.7, 0.03])
+        slider = Slider(slider_ax, label, low, high, valinit=params[name])
+        slider.on_changed(lambda value, name=name: on_change(name, value))
+        sliders.append(slider)  # Keep references so the widgets stay responsive
+
+    plt.show()
+    return pipeline.params
+
+
+def main():
+    params = {
+        "a": 60,
+        "b": 2,
+        "spacing": 10,
+        "y_offset_percentage": 25,
+        "rotation_angle_degrees": wrap.ROTATION_ANGLE_DEGREES,
+        "cylinder_radius": wrap.CYLINDER_RADIUS,
+    }
+    final = run_tuner(params)
+    print("Tuned parameters:")
+    for name, value in final.items():
+        print(f"  {name} = {value:g}")
+
+if __name__ == "__main__":
+    main()
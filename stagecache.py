@@ -0,0 +1,197 @@
+import ast
+import hashlib
+import json
+import os
+import shutil
+import time
+
+DEFAULT_CACHE_DIR = ".stage_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+MODULES_RECORD = "modules.json"  # Per entry: hashes of the local modules the cached run imported
+
+
+# -------------------------------
+# 1. Hashing Helpers
+# -------------------------------
+def hash_file(filename, chunk_size=1 << 20):
+    """Returns the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(filename, mode="rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_params(params):
+    """Returns a stable SHA-256 hex digest of a JSON-serialisable parameter dict."""
+    encoded = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def imported_names(filename):
+    """
+    Returns the top-level module names a script imports, including
+    importlib.import_module("...") calls for modules whose names are not
+    valid identifiers (such as 3dmodelwrappy).
+    """
+    with open(filename, mode="r", encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filename)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+        elif (isinstance(node, ast.Call) and node.args and isinstance(node.args[0], ast.Constant)
+              and isinstance(node.args[0].value, str)
+              and getattr(node.func, "attr", getattr(node.func, "id", None)) == "import_module"):
+            names.add(node.args[0].value.split(".")[0])
+    return names
+
+
+def local_dependencies(script_name):
+    """
+    Returns the local modules (.py files next to the script) that a script
+    imports, directly or through other local modules, sorted by path.
+    """
+    directory = os.path.dirname(os.path.abspath(script_name))
+    found, pending = set(), [script_name]
+    while pending:
+        for name in imported_names(pending.pop()):
+            path = os.path.join(directory, f"{name}.py")
+            if path not in found and os.path.isfile(path):
+                found.add(path)
+                pending.append(path)
+    found.discard(os.path.abspath(script_name))
+    return sorted(found)
+
+
+def hash_modules(filenames):
+    """Returns {module file: SHA-256} for the given module files."""
+    return {filename: hash_file(filename) for filename in filenames}
+
+
+# Runs a stage script the way `python script` would, then records which local
+# modules (files next to the script) it actually imported. argv: script, record file
+TRACE_IMPORTS = """
+import json, os, runpy, sys
+script, record = sys.argv[1:3]
+directory = os.path.dirname(os.path.abspath(script))
+sys.argv = [script]
+sys.path[0] = directory
+try:
+    runpy.run_path(script, run_name="__main__")
+finally:
+    loaded = {os.path.abspath(m.__file__) for m in list(sys.modules.values()) if getattr(m, "__file__", None)}
+    local = [f for f in loaded if os.path.dirname(f) == directory and f != os.path.abspath(script)]
+    with open(record, "w") as file:
+        json.dump(sorted(os.path.relpath(f) for f in local), file)
+"""
+
+
+def traced_command(script_name, record_file):
+    """Command line that runs script_name and writes the local modules it imported to record_file."""
+    return ["python", "-c", TRACE_IMPORTS, script_name, record_file]
+
+
+def read_module_record(record_file):
+    """Returns the module files listed by a traced run, or None if the run left no record."""
+    try:
+        with open(record_file, mode="r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+# -------------------------------
+# 2. Content-Addressed Stage Cache
+# -------------------------------
+class StageCache:
+    """
+    On-disk cache of pipeline stage outputs.
+
+    Each entry is a directory named after a key built from the stage name,
+    its parameters and the hashes of its input files, so a stage only hits
+    the cache when nothing upstream of it has changed. The total size is
+    capped at max_bytes; the least recently used entries are evicted first.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def stage_key(self, stage_name, params, input_files=()):
+        """Builds the cache key for a stage run. Missing inputs make the stage uncacheable (None)."""
+        input_hashes = []
+        for filename in input_files:
+            if not os.path.exists(filename):
+                return None
+            input_hashes.append([os.path.basename(filename), hash_file(filename)])
+        return hash_params({"stage": stage_name, "params": params, "inputs": input_hashes})
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def restore(self, key, output_files):
+        """
+        Copies a cached entry's outputs into place. Returns True on a cache hit.
+        An entry only hits while the modules its run imported are unchanged.
+        Only the files stored with the entry are restored; declared outputs the
+        stage did not write on that run are left alone.
+        """
+        entry = self._entry_dir(key)
+        if not os.path.isdir(entry):
+            return False
+        modules = read_module_record(os.path.join(entry, MODULES_RECORD)) or {}
+        for filename, digest in modules.items():
+            if not os.path.exists(filename) or hash_file(filename) != digest:
+                return False
+
+        for filename in output_files:
+            path = os.path.join(entry, os.path.basename(filename))
+            if os.path.exists(path):
+                shutil.copyfile(path, filename)
+
+        now = time.time()
+        os.utime(entry, (now, now))  # Mark as most recently used
+        return True
+
+    def store(self, key, output_files, modules=None):
+        """
+        Saves a stage's outputs under key, with the {module file: hash} its run
+        imported, then evicts old entries if over the size limit.
+        """
+        entry = self._entry_dir(key)
+        staging = f"{entry}.tmp{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        for filename in output_files:
+            shutil.copyfile(filename, os.path.join(staging, os.path.basename(filename)))
+        with open(os.path.join(staging, MODULES_RECORD), mode="w") as file:
+            json.dump(modules or {}, file)
+
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(staging, entry)  # Readers never see a half-written entry
+        self.evict()
+
+    def _entries(self):
+        """Returns (last_used, size_bytes, path) for every complete cache entry."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if not os.path.isdir(path) or ".tmp" in name:
+                continue
+            size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            entries.append((os.path.getmtime(path), size, path))
+        return entries
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
@@ -0,0 +1,83 @@
+import numpy as np
+
+from arcpath import ArcLengthPath
+
+
+# -------------------------------
+# 1. Surfaces
+# -------------------------------
+class CylinderSurface:
+    """
+    The cylinder used by 3dmodelwrappy.map_points_to_cylinder (axis along Y,
+    x = r*sin(theta), z = r*cos(theta), theta = (u - center_x) / r).
+
+    A surface maps 3D points to and from surface parameters (u, v). The
+    cylinder is developable and (u, v) is its unrolled sheet, so straight
+    lines in (u, v) are geodesics and their lengths are true surface
+    distances. Other surfaces can be added by providing the same
+    unwrap/wrap pair.
+    """
+
+    def __init__(self, radius, center_x=0.0):
+        self.radius = radius
+        self.center_x = center_x
+
+    def wrap(self, u, v):
+        """Surface parameters (u = unrolled arc length plus center_x, v = height) to 3D points."""
+        theta = (np.asarray(u, dtype=float) - self.center_x) / self.radius
+        return self.radius * np.sin(theta), np.array(v, dtype=float), self.radius * np.cos(theta)
+
+    def unwrap(self, x, y, z):
+        """
+        3D points on the surface to (u, v). Angles are unwrapped along the
+        path, so a sticker going more than once around still unrolls flat.
+        """
+        theta = np.unwrap(np.arctan2(np.asarray(x, dtype=float), np.asarray(z, dtype=float)))
+        return self.radius * theta + self.center_x, np.array(y, dtype=float)
+
+
+# -------------------------------
+# 2. Equal Geodesic Spacing
+# -------------------------------
+def resample_on_surface(surface, x, y, z, spacing):
+    """
+    Resamples a wrapped path so consecutive points are `spacing` apart by
+    surface (geodesic) distance. The path is unwrapped to surface parameters,
+    resampled there with one cumulative-length inversion over all points, and
+    wrapped back. Returns x, y, z arrays; only the last step may be shorter.
+    """
+    u, v = surface.unwrap(x, y, z)
+    resampled_u, resampled_v = ArcLengthPath(u, v).resample(spacing)
+    return surface.wrap(resampled_u, resampled_v)
+
+
+def iter_resample_on_surface(surface, chunks, spacing):
+    """
+    Streaming resample_on_surface: chunks yields consecutive (x, y, z) pieces
+    of one wrapped path, and the same resampled points are yielded piece by
+    piece, so memory stays bounded by the largest chunk. Each piece is joined
+    to the last point of the one before, and the spacing offset is carried
+    across the join.
+    """
+    next_s = 0.0  # Arc length into the current piece of its first resampled point
+    previous = None  # Last point so far as ((x, y, z), u, v)
+    for x, y, z in chunks:
+        if len(x) == 0:
+            continue
+        if previous is not None:
+            (last_x, last_y, last_z), last_u, _ = previous
+            x, y, z = np.append(last_x, x), np.append(last_y, y), np.append(last_z, z)
+        u, v = surface.unwrap(x, y, z)
+        if previous is not None:
+            u += previous[1] - u[0]  # Continue the unrolled angle from the previous piece
+        previous = (x[-1], y[-1], z[-1]), u[-1], v[-1]
+        if len(u) < 2:
+            continue
+
+        path = ArcLengthPath(u, v)
+        resampled_u, resampled_v = path.resample(spacing, start=next_s, include_end=False)
+        next_s += len(resampled_u) * spacing - path.length
+        yield surface.wrap(resampled_u, resampled_v)
+
+    if previous is not None and next_s < spacing:  # Keep the end of the path unless it was just saved
+        yield surface.wrap(np.array([previous[1]]), np.array([previous[2]]))
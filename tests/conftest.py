@@ -0,0 +1,7 @@
+import os
+import sys
+
+os.environ.setdefault("MPLBACKEND", "Agg")  # Plotting scripts run headless under test
+
+# The scripts live at the top of the repository rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from arcpath import ArcLengthPath
+from scarfspiral import ScarfSpiral
+
+
+def test_from_spiral_matches_rings():
+    spiral = ScarfSpiral(60, 2, 10, 3)
+    path = ArcLengthPath.from_spiral(spiral, 500)
+    x, y = spiral.sample(500)
+    assert len(path) == 3 * 499 + 1
+    assert np.allclose(path.point_at(0.0), (x[0, 0], y[0, 0]))
+    assert np.allclose(path.point_at(path.length), (x[-1, -1], y[-1, -1]))
+
+
+def test_from_spiral_without_rings_raises():
+    # The start ellipse already touches the bounding ellipse, so no ring fits
+    spiral = ScarfSpiral.from_bbox(60, 2, 10, 60, 2)
+    assert spiral.rings == 0
+    with pytest.raises(ValueError, match="no rings"):
+        ArcLengthPath.from_spiral(spiral)
+
+
+def test_from_rings_without_rings_raises():
+    with pytest.raises(ValueError, match="zero rings"):
+        ArcLengthPath.from_rings([])
@@ -0,0 +1,53 @@
+import importlib
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from boundary import EllipseBoundary, PolygonBoundary
+from scarfspiral import count_rings
+
+spiral_script = importlib.import_module("spiraleclipSPACINGEQUALPOINT")
+
+CASES = [(60, 2, 10, 60 * 21, 2 * 21), (30, 10, 3, 400, 90), (5, 1, 0.7, 40, 12)]
+
+
+def baseline_ring_count(a, b, spacing, bbox_a, bbox_b, num_points=2000):
+    """The original nested-ellipse loop: grow until a sampled ellipse touches the bounding ellipse."""
+    t = np.linspace(0, 2 * np.pi, num_points)
+    rings = 0
+    while True:
+        a, b = a + spacing, b + spacing
+        x, y = a * np.cos(t), b * np.sin(t)
+        if any((px**2 / bbox_a**2 + py**2 / bbox_b**2) >= 1 for px, py in zip(x, y)):
+            return rings
+        rings += 1
+
+
+@pytest.mark.parametrize("a, b, spacing, bbox_a, bbox_b", CASES)
+def test_default_boundary_matches_original_ring_count(a, b, spacing, bbox_a, bbox_b):
+    expected = baseline_ring_count(a, b, spacing, bbox_a, bbox_b)
+    assert count_rings(a, b, spacing, bbox_a, bbox_b) == expected
+    assert count_rings(a, b, spacing, boundary=EllipseBoundary(bbox_a, bbox_b)) == expected
+
+
+@pytest.mark.parametrize("a, b, spacing, bbox_a, bbox_b", CASES)
+def test_script_default_boundary_matches_explicit_ellipse(a, b, spacing, bbox_a, bbox_b):
+    fig, (ax_default, ax_explicit) = plt.subplots(1, 2)
+    default = spiral_script.draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax_default, 25,
+                                                            boundary=None)
+    explicit = spiral_script.draw_nested_ellipses_with_scarf(a, b, spacing, bbox_a, bbox_b, ax_explicit, 25,
+                                                             boundary=EllipseBoundary(bbox_a, bbox_b))
+    plt.close(fig)
+
+    assert len(default) == len(explicit) == baseline_ring_count(a, b, spacing, bbox_a, bbox_b)
+    for (x0, y0), (x1, y1) in zip(default, explicit):
+        assert np.array_equal(x0, x1) and np.array_equal(y0, y1)
+
+
+def test_polygon_ring_escapes_matches_point_test():
+    boundary = PolygonBoundary.rounded_rectangle(2400, 80, 20)
+    theta = np.linspace(0, 2 * np.pi, 2000)
+    for size in np.linspace(1, 1300, 60):
+        x, y = size * np.cos(theta), size / 30 * np.sin(theta)
+        assert boundary.ring_escapes(x, y) == (not np.all(boundary.contains(x, y)))
@@ -0,0 +1,35 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+import checkcsvMATPLOT
+from pointpyramid import PointPyramid
+
+
+def test_x_only_zoom_requeries_the_view_once(monkeypatch):
+    t = np.linspace(0, 20 * np.pi, 5000)
+    pyramid = PointPyramid.build(t * np.cos(t), t * np.sin(t))
+    queries = []
+    query = pyramid.query
+
+    def counting_query(level, x0, x1, y0, y1):
+        queries.append((x0, x1, y0, y1))
+        return query(level, x0, x1, y0, y1)
+
+    monkeypatch.setattr(pyramid, "query", counting_query)
+    monkeypatch.setattr(plt, "show", lambda: None)
+    checkcsvMATPLOT.plot_points_with_matplotlib(pyramid)
+    fig = plt.gcf()
+    ax = fig.axes[0]
+
+    try:
+        # Like the "x" key during a zoom, which only sets the x bounds
+        queries.clear()
+        ax.set_xbound(-10, 10)
+        assert queries == [(-10, 10, *sorted(ax.get_ylim()))]
+
+        # Limits that are already shown do not query again
+        ax.set_xlim(-10, 10)
+        ax.set_ylim(*ax.get_ylim())
+        assert len(queries) == 1
+    finally:
+        plt.close(fig)
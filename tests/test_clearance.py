@@ -0,0 +1,26 @@
+import importlib
+
+import matplotlib.pyplot as plt
+
+from clearance import check_rings_clearance, check_spiral_clearance
+from scarfspiral import ScarfSpiral
+
+spiral_script = importlib.import_module("spiraleclipSPACINGEQUALPOINT")
+
+
+def test_no_rings_give_an_empty_report():
+    assert check_rings_clearance([], 5.0) == []
+    assert check_spiral_clearance(ScarfSpiral.from_bbox(60, 2, 10, 60, 2), 5.0) == []
+
+
+def test_script_rings_without_room_give_an_empty_report():
+    # The start ellipse already touches the bounding ellipse, so no ring fits
+    fig, ax = plt.subplots()
+    rings = spiral_script.draw_nested_ellipses_with_scarf(60, 2, 10, 60, 2, ax, 25)
+    plt.close(fig)
+    assert rings == []
+    assert check_rings_clearance(rings, 5.0) == []
+
+
+def test_tight_rings_are_reported():
+    assert check_spiral_clearance(ScarfSpiral(60, 2, 1.0, 4), 5.0)
@@ -0,0 +1,27 @@
+import io
+
+import numpy as np
+
+from gcodeexport import GcodeWriter, fit_moves
+
+
+def test_collinear_points_that_turn_back_are_not_merged():
+    moves = list(fit_moves([0, 10, 5, 20], [0, 0, 0, 0]))
+    assert [end for end, _ in moves] == [1, 2, 3]
+
+    writer = GcodeWriter(io.StringIO())
+    writer.write_path([0, 10, 5, 20], [0, 0, 0, 0])
+    assert np.isclose(writer.cut_length, 30.0)
+
+
+def test_straight_run_forwards_is_one_move():
+    x = np.linspace(0, 50, 26)
+    assert list(fit_moves(x, 0.5 * x)) == [(25, ("G1",))]
+
+
+def test_circle_becomes_arcs_with_true_length():
+    theta = np.linspace(0, 1.5 * np.pi, 400)
+    writer = GcodeWriter(io.StringIO())
+    writer.write_path(10 * np.cos(theta), 10 * np.sin(theta))
+    assert writer.move_counts["G3"] >= 1 and writer.move_counts["G1"] == 0
+    assert np.isclose(writer.cut_length, 10 * 1.5 * np.pi, rtol=1e-3)
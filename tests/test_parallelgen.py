@@ -0,0 +1,32 @@
+import gc
+import os
+
+import numpy as np
+
+from parallelgen import fill_in_parallel
+from scarfspiral import ScarfSpiral
+
+
+def shared_segments():
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+def test_parallel_sample_matches_serial_without_copying():
+    spiral = ScarfSpiral(60, 2, 10, 40)
+    before = shared_segments()
+    x, y = spiral.sample(500, workers=2)
+    serial_x, serial_y = spiral.sample(500)
+
+    assert np.array_equal(x, serial_x) and np.array_equal(y, serial_y)
+    assert x.base is not None and x.base is y.base  # Views of the shared block, not a copy
+    assert shared_segments() == before  # The segment name is already unlinked
+
+
+def test_shared_result_outlives_its_base():
+    x = fill_in_parallel(_fill_index, (2, 100), 100, workers=2)[1]
+    gc.collect()
+    assert np.array_equal(x, np.arange(100))
+
+
+def _fill_index(out, start, stop):
+    out[:, start:stop] = np.arange(start, stop)
@@ -0,0 +1,27 @@
+import numpy as np
+
+from ellipsemath import ellipse_perimeter
+from scarfspiral import sample_blended_ellipses
+
+
+def test_plain_ring_counts_come_from_the_exact_perimeter():
+    a = np.array([10.0, 20.0, 35.0])
+    b = np.array([5.0, 8.0, 30.0])
+    _, _, counts = sample_blended_ellipses(a, a, b, b, 0.7)
+    np.testing.assert_array_equal(counts, np.rint(ellipse_perimeter(a, b) / 0.7).astype(int) + 1)
+
+
+def test_blended_points_stay_on_their_own_curve():
+    a0, a1 = np.array([20.0, 15.0, 15.0]), np.array([15.0, 15.0, 0.0])
+    b0, b1 = np.array([12.0, 7.0, 7.0]), np.array([7.0, 7.0, 0.0])
+    x, y, counts = sample_blended_ellipses(a0, a1, b0, b1, 0.5)
+    split_at = np.cumsum(counts)[:-1]
+    for (cx, cy), ra0, ra1, rb0, rb1 in zip(zip(np.split(x, split_at), np.split(y, split_at)), a0, a1, b0, b1):
+        # Each curve starts at (a0, 0) and ends at (a1, 0), nothing bleeds into its neighbour
+        np.testing.assert_allclose([cx[0], cy[0], cx[-1], cy[-1]], [ra0, 0, ra1, 0], atol=1e-9)
+
+    # The plain ring's points lie on its ellipse and are evenly spaced
+    ring_x, ring_y = np.split(x, split_at)[1], np.split(y, split_at)[1]
+    np.testing.assert_allclose((ring_x / 15) ** 2 + (ring_y / 7) ** 2, 1, atol=1e-4)
+    steps = np.hypot(np.diff(ring_x), np.diff(ring_y))
+    assert np.ptp(steps) < 0.01
@@ -0,0 +1,70 @@
+import csv
+import importlib
+
+import numpy as np
+import pytest
+
+import spiralserver
+from scarfspiral import ScarfSpiral
+from surfaceresample import CylinderSurface, resample_on_surface
+
+spiral_script = importlib.import_module("spiraleclipSPACINGEQUALPOINT")
+wrap = importlib.import_module("3dmodelwrappy")
+
+SMALL = {"a": 60, "b": 4, "spacing": 10, "bbox_multiplier": 8}
+
+
+def test_defaults_match_the_pipeline_resampling():
+    response = spiralserver.handle_request(dict(SMALL))
+
+    spiral = ScarfSpiral.from_bbox(60, 4, 10, 60 * 8, 4 * 8, 2000)
+    rings_x, rings_y = spiral.sample(2000)
+    x, y = spiral_script.resample_rings(list(zip(rings_x, rings_y)), spiralserver.DEFAULT_PARAMS["point_spacing"],
+                                        25 * 10 / 100)
+    assert response["rings"] == spiral.rings > 0
+    np.testing.assert_allclose(response["flat"], np.column_stack((x, y)))
+    assert response["points"] == len(response["sticker"])
+
+
+def test_null_point_spacing_keeps_every_nth_point():
+    spiral_only = spiralserver.handle_request({**SMALL, "point_spacing": None})
+    num_points = spiralserver.DEFAULT_PARAMS["num_points_per_ellipse"]
+    per_ring = len(range(0, num_points, spiralserver.DEFAULT_PARAMS["csv_point_reduction_factor"]))
+    assert spiral_only["points"] == spiral_only["rings"] * per_ring
+
+
+def test_surface_point_spacing_matches_3dmodelwrappy():
+    response = spiralserver.handle_request({**SMALL, "surface_point_spacing": 4.0, "cylinder_radius": 100})
+    flat = np.array(response["flat"])
+
+    rotated_x, rotated_y = wrap.rotate_points(flat[:, 0], flat[:, 1], response["params"]["rotation"])
+    center_x = (rotated_x.min() + rotated_x.max()) / 2
+    mapped = wrap.map_points_to_cylinder(rotated_x, rotated_y, 100, center_x)
+    expected = resample_on_surface(CylinderSurface(100, center_x), *mapped, 4.0)
+    np.testing.assert_allclose(response["sticker"], np.column_stack(expected))
+    assert len(response["sticker"]) != len(flat)
+
+
+def test_output_dir_writes_both_csv_files(tmp_path):
+    response = spiralserver.handle_request({**SMALL, "output_dir": str(tmp_path)})
+
+    assert "flat" not in response
+    with open(response["files"]["sticker_coordinates"], newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["X", "Y", "Z"] and len(rows) - 1 == response["points"]
+    assert (tmp_path / "ellipse_points.csv").exists()
+
+
+@pytest.mark.parametrize("request_body", [
+    {"output_dir": 5},
+    {"output_dir": ["out"]},
+    {"include_points": "yes"},
+    {"point_spacing": 0},
+    {"surface_point_spacing": "fine"},
+    {"a": None},
+    {"colour": "red"},
+])
+def test_bad_requests_raise_value_error(request_body):
+    # The HTTP handler turns ValueError into a 400 response
+    with pytest.raises(ValueError):
+        spiralserver.handle_request(request_body)
@@ -0,0 +1,31 @@
+import spiraltuner
+from spiraltuner import FRAME_BUDGET, SLIDERS, TunerPipeline
+
+
+def worst_case_params(spacing):
+    """Largest start ellipse with the tightest spacing the sliders allow: the most rings."""
+    return {"a": SLIDERS["a"][2], "b": SLIDERS["b"][2], "spacing": spacing, "y_offset_percentage": 25,
+            "rotation_angle_degrees": 60, "cylinder_radius": 2000}
+
+
+def test_full_recompute_fits_frame_budget_at_minimum_spacing():
+    minimum = SLIDERS["spacing"][1]
+    for spacing in (minimum, minimum + 0.1, minimum + 0.2, minimum + 0.5):
+        spiraltuner.preview_spiral.cache_clear()
+        pipeline = TunerPipeline(worst_case_params(spacing))
+        elapsed = []
+        for _ in range(3):
+            pipeline.results.clear()
+            pipeline.compute()
+            elapsed.append(pipeline.last_elapsed)
+            spiraltuner.preview_spiral.cache_clear()
+        assert max(elapsed) < FRAME_BUDGET, f"spacing {spacing}: {max(elapsed) * 1000:.1f} ms"
+
+
+def test_later_stages_reuse_the_generated_spiral():
+    pipeline = TunerPipeline(worst_case_params(10))
+    results = pipeline.compute()
+    generated = results["generate"]
+    assert pipeline.set("cylinder_radius", 500) == "map"
+    pipeline.compute()
+    assert results["generate"] is generated
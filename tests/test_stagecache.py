@@ -0,0 +1,93 @@
+import os
+import shutil
+
+import main
+from stagecache import StageCache, local_dependencies
+
+
+def write(path, text):
+    path.write_text(text)
+    return path
+
+
+def test_local_dependencies_follow_imports(tmp_path):
+    write(tmp_path / "helper.py", "import inner\n")
+    write(tmp_path / "inner.py", "import numpy\n")
+    write(tmp_path / "3dnamed.py", "")
+    script = write(tmp_path / "stage.py", "import importlib\nimport helper\n"
+                   "named = importlib.import_module('3dnamed')\n")
+    names = [path.rsplit("/", 1)[-1] for path in local_dependencies(str(script))]
+    assert names == ["3dnamed.py", "helper.py", "inner.py"]
+
+
+def test_stage_reruns_when_imported_module_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write(tmp_path / "inner.py", "VALUE = 1\n")
+    write(tmp_path / "helper.py", "from inner import VALUE\n")
+    write(tmp_path / "stage.py", "from helper import VALUE\nopen('out.txt', 'w').write(str(VALUE))\n")
+    stage = {"script": "stage.py", "inputs": [], "outputs": ["out.txt"]}
+    cache = StageCache(str(tmp_path / "cache"))
+
+    assert main.run_stage(stage, cache)
+    assert (tmp_path / "out.txt").read_text() == "1"
+
+    # Unchanged: restored from the cache
+    (tmp_path / "out.txt").write_text("stale")
+    assert main.run_stage(stage, cache)
+    assert (tmp_path / "out.txt").read_text() == "1"
+
+    # A module imported only indirectly changes: the stage must run again
+    write(tmp_path / "inner.py", "VALUE = 2\n")
+    assert main.run_stage(stage, cache)
+    assert (tmp_path / "out.txt").read_text() == "2"
+
+
+def test_every_declared_output_is_cached(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write(tmp_path / "stage.py", "open('points.csv', 'w').write('p')\nopen('sticker.csv', 'w').write('s')\n")
+    stage = {"script": "stage.py", "inputs": [], "outputs": ["points.csv", "sticker.csv"]}
+    cache = StageCache(str(tmp_path / "cache"))
+
+    assert main.run_stage(stage, cache)
+    (tmp_path / "points.csv").unlink()
+    (tmp_path / "sticker.csv").unlink()
+    assert main.run_stage(stage, cache)
+    assert (tmp_path / "points.csv").read_text() == "p"
+    assert (tmp_path / "sticker.csv").read_text() == "s"
+
+
+def test_outputs_not_written_are_left_alone(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write(tmp_path / "stage.py", "open('points.csv', 'w').write('p')\n")
+    write(tmp_path / "sticker.csv", "from another stage")
+    stage = {"script": "stage.py", "inputs": [], "outputs": ["points.csv", "sticker.csv"]}
+    cache = StageCache(str(tmp_path / "cache"))
+
+    assert main.run_stage(stage, cache)
+    write(tmp_path / "sticker.csv", "newer")
+    assert main.run_stage(stage, cache)  # Cache hit
+    assert (tmp_path / "sticker.csv").read_text() == "newer"
+
+
+def test_wrap_parameters_do_not_regenerate_the_spiral(tmp_path, monkeypatch, capsys):
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for name in os.listdir(repo):
+        if name.endswith(".py"):
+            shutil.copy(os.path.join(repo, name), tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    spiral_stage, wrap_stage = main.STAGES[0], main.STAGES[1]
+    cache = StageCache(str(tmp_path / "cache"))
+
+    assert main.run_stage(spiral_stage, cache)
+    assert main.run_stage(wrap_stage, cache)
+    capsys.readouterr()
+
+    wrap_script = tmp_path / "3dmodelwrappy.py"
+    source = wrap_script.read_text()
+    assert "CYLINDER_RADIUS = 2000" in source
+    wrap_script.write_text(source.replace("CYLINDER_RADIUS = 2000", "CYLINDER_RADIUS = 1500"))
+
+    assert main.run_stage(spiral_stage, cache)
+    assert "skipped (outputs restored from cache)" in capsys.readouterr().out
+    assert main.run_stage(wrap_stage, cache)
+    assert "Running 3dmodelwrappy.py" in capsys.readouterr().out
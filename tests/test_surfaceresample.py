@@ -0,0 +1,54 @@
+import importlib
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from surfaceresample import CylinderSurface, iter_resample_on_surface, resample_on_surface
+
+wrap = importlib.import_module("3dmodelwrappy")
+spiral_script = importlib.import_module("spiraleclipSPACINGEQUALPOINT")
+
+A, B, SPACING, BBOX_A, BBOX_B = 60, 2, 10, 60 * 21, 2 * 21
+REDUCTION, Y_OFFSET_PERCENTAGE = 50, 25
+
+
+def test_streamed_resampling_matches_whole_path():
+    surface = CylinderSurface(300, 40.0)
+    t = np.linspace(0, 14 * np.pi, 5000)  # More than once around the cylinder
+    x, y, z = surface.wrap(40 + 30 * t, 5 * np.sin(t))
+    expected = resample_on_surface(surface, x, y, z, 2.0)
+
+    pieces = [(x[i:j], y[i:j], z[i:j]) for i, j in zip(range(0, 5000, 333), range(333, 5333, 333))]
+    streamed = [np.concatenate(c) for c in zip(*iter_resample_on_surface(surface, pieces, 2.0))]
+    assert len(streamed[0]) == len(expected[0])
+    for got, want in zip(streamed, expected):
+        assert np.allclose(got, want, atol=1e-6)
+
+
+@pytest.mark.parametrize("point_spacing", [None, 2.5])
+@pytest.mark.parametrize("surface_spacing", [None, 3.0])
+def test_stream_and_in_memory_stickers_match(tmp_path, monkeypatch, point_spacing, surface_spacing):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(wrap, "SURFACE_POINT_SPACING", surface_spacing)
+    monkeypatch.setattr(wrap, "plot_mapping", lambda *args: None)
+
+    # In memory: the spiral script's CSV, then 3dmodelwrappy.py
+    fig, ax = plt.subplots()
+    rings = spiral_script.draw_nested_ellipses_with_scarf(A, B, SPACING, BBOX_A, BBOX_B, ax, Y_OFFSET_PERCENTAGE)
+    plt.close(fig)
+    if point_spacing:
+        y_offset = Y_OFFSET_PERCENTAGE * SPACING / 100
+        spiral_script.write_path_to_csv(*spiral_script.resample_rings(rings, point_spacing, y_offset))
+    else:
+        spiral_script.write_points_to_csv(rings, REDUCTION, SPACING, Y_OFFSET_PERCENTAGE)
+    wrap.main()
+    in_memory = np.loadtxt("sticker_coordinates.csv", delimiter=",", skiprows=1)
+
+    spiral_script.stream_spiral_to_disk(A, B, SPACING, BBOX_A, BBOX_B, REDUCTION, Y_OFFSET_PERCENTAGE,
+                                        points_filename="stream_points.csv",
+                                        sticker_filename="stream_sticker.csv", point_spacing=point_spacing)
+    streamed = np.loadtxt("stream_sticker.csv", delimiter=",", skiprows=1)
+
+    assert streamed.shape == in_memory.shape
+    assert np.allclose(streamed, in_memory, atol=1e-6)
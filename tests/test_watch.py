@@ -0,0 +1,84 @@
+import main
+
+
+def test_edits_saved_during_a_run_trigger_another_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "spiral.py").write_text("v1")
+    (tmp_path / "wrap.py").write_text("v1")
+    stages = [
+        {"script": "spiral.py", "inputs": [], "outputs": ["points.csv"]},
+        {"script": "wrap.py", "inputs": ["points.csv"], "outputs": ["sticker.csv"]},
+    ]
+    runs = []
+
+    def fake_run_pipeline(stages_to_run, cache=None):
+        runs.append([stage["script"] for stage in stages_to_run])
+        for stage in stages_to_run:
+            for output in stage["outputs"]:
+                (tmp_path / output).write_text(f"run {len(runs)}")
+        if len(runs) == 1:
+            (tmp_path / "wrap.py").write_text("edited while the first run was going")
+
+    polls = []
+
+    def fake_sleep(seconds):
+        polls.append(seconds)
+        if len(polls) == 1:
+            (tmp_path / "spiral.py").write_text("v2")
+        if len(polls) > 10:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(main, "run_pipeline", fake_run_pipeline)
+    monkeypatch.setattr(main.time, "sleep", fake_sleep)
+    main.watch(poll_interval=0, debounce=0, stages=stages)
+
+    # The second run comes from the mid-run edit; the runs' own outputs trigger nothing
+    assert runs == [["spiral.py", "wrap.py"], ["wrap.py"]]
+
+
+def test_editing_an_imported_module_reruns_the_stage_that_imports_it(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "spiral.py").write_text("from shapes import ring\n")
+    (tmp_path / "shapes.py").write_text("import helpers\nring = 1\n")
+    (tmp_path / "helpers.py").write_text("")
+    (tmp_path / "wrap.py").write_text("")
+    stages = [
+        {"script": "spiral.py", "inputs": [], "outputs": ["points.csv"]},
+        {"script": "wrap.py", "inputs": ["points.csv"], "outputs": ["sticker.csv"]},
+        {"script": "viewer.py", "inputs": ["other.csv"], "outputs": []},
+    ]
+    runs = []
+
+    def fake_run_pipeline(stages_to_run, cache=None):
+        runs.append([stage["script"] for stage in stages_to_run])
+        for stage in stages_to_run:
+            for output in stage["outputs"]:
+                (tmp_path / output).write_text(f"run {len(runs)}")
+
+    polls = []
+
+    def fake_sleep(seconds):
+        polls.append(seconds)
+        if len(polls) == 1:
+            (tmp_path / "helpers.py").write_text("# edited\n")  # Imported only through shapes.py
+        if len(polls) > 5:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(main, "run_pipeline", fake_run_pipeline)
+    monkeypatch.setattr(main.time, "sleep", fake_sleep)
+    main.watch(poll_interval=0, debounce=0, stages=stages)
+
+    assert runs == [["spiral.py", "wrap.py"]]
+
+
+def test_affected_stages_maps_module_changes_to_their_scripts():
+    stages = [
+        {"script": "spiral.py", "inputs": [], "outputs": ["points.csv"]},
+        {"script": "wrap.py", "inputs": ["points.csv"], "outputs": ["sticker.csv"]},
+        {"script": "distances.py", "inputs": ["sticker.csv"], "outputs": ["distances.csv"]},
+    ]
+    dependencies = {"spiral.py": ["scarfspiral.py"], "wrap.py": ["surfaceresample.py"], "distances.py": []}
+
+    affected = main.affected_stages(["surfaceresample.py"], stages, dependencies)
+    assert [stage["script"] for stage in affected] == ["wrap.py", "distances.py"]
+    assert main.affected_stages(["surfaceresample.py"], stages) == []